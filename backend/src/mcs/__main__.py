@@ -112,6 +112,8 @@ class ServerManager:
                 reload=self.dev_mode,
                 reload_dirs=["backend/src/mcs"] if self.dev_mode else None,
                 factory=self.dev_mode,  # Enable factory mode for hot reload
+                # Each service owns in-process state (hardware connections, websocket
+                # subscribers), so it runs as a single worker
                 workers=1
             )
             server = uvicorn.Server(config)
@@ -410,6 +412,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    # All servers share the loop created here, so uvicorn's own loop selection never
+    # applies; use uvloop when it is installed (uvicorn[standard])
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -103,11 +103,19 @@ def main():
         logger.info(f"Port: {port}")
         
         # Run service
+        # uvloop/httptools are used when installed (uvicorn[standard])
         uvicorn.run(
             create_communication_service(),
             host=host,
             port=port,
-            log_level="info"
+            log_level="info",
+            loop="auto",
+            http="auto",
+            # Websocket keepalive uses protocol ping/pong frames handled by the server
+            ws_ping_interval=20.0,
+            ws_ping_timeout=20.0,
+            # Compress websocket frames for clients that negotiate permessage-deflate
+            ws_per_message_deflate=True
         )
 
     except Exception as e:
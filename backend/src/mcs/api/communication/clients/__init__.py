@@ -1,11 +1,20 @@
 """Communication client implementations."""
 
 from mcs.api.communication.clients.mock import MockPLCClient
-from mcs.api.communication.clients.plc import PLCClient
-from mcs.api.communication.clients.ssh import SSHClient
 
 __all__ = [
     "MockPLCClient",
     "PLCClient",
     "SSHClient",
 ]
+
+
+def __getattr__(name: str):
+    """Import hardware clients on first use so mock mode never loads their drivers."""
+    if name == "PLCClient":
+        from mcs.api.communication.clients.plc import PLCClient
+        return PLCClient
+    if name == "SSHClient":
+        from mcs.api.communication.clients.ssh import SSHClient
+        return SSHClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -84,7 +84,7 @@ class MockPLCClient:
             raise KeyError(f"Tag not found: {tag}")
             
         value = self._plc_tags[tag]
-        logger.debug(f"Read mock tag {tag} = {value}")
+        logger.debug("Read mock tag {} = {}", tag, value)
         return value
 
     async def write_tag(self, tag: str, value: Any) -> None:
@@ -113,7 +113,7 @@ class MockPLCClient:
             with open(mock_data_path, 'w') as f:
                 json.dump(data, f, indent=2)
                 
-            logger.debug(f"Updated mock data file for tag {tag}: {old_value} -> {value}")
+            logger.debug("Updated mock data file for tag {}: {} -> {}", tag, old_value, value)
         except Exception as e:
             logger.error(f"Failed to persist mock tag change to file: {e}")
 
@@ -97,7 +97,7 @@ class PLCClient:
         try:
             # The library handles type validation and conversion
             await self._plc.set({tag: value})
-            logger.debug(f"Wrote tag {tag} = {value}")
+            logger.debug("Wrote tag {} = {}", tag, value)
             
         except Exception as e:
             logger.error(f"Failed to write tag '{tag}' = {value} to PLC: {str(e)}")
@@ -145,12 +145,12 @@ class PLCClient:
                 
             if missing_tags:
                 logger.warning(f"Tags not found in PLC: {missing_tags}")
-                logger.debug(f"Available PLC tags: {list(self._tags.keys())}")
+                logger.opt(lazy=True).debug("Available PLC tags: {}", lambda: list(self._tags))
                 
             if not result:
                 logger.error("No valid tags found in request")
                 
-            logger.debug(f"Read {len(result)} PLC tags")
+            logger.debug("Read {} PLC tags", len(result))
             return result
             
         except Exception as e:
@@ -1,7 +1,6 @@
 """SSH communication client."""
 
 import asyncio
-import time
 from typing import Any, Dict, Optional, List
 from loguru import logger
 import paramiko
@@ -57,8 +56,9 @@ class SSHClient:
                 self._client = paramiko.SSHClient()
                 self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-                # Connect and get shell
-                self._client.connect(
+                # Connect and get shell; paramiko blocks, so keep it off the event loop
+                await asyncio.to_thread(
+                    self._client.connect,
                     self._host,
                     port=self._port,
                     username=self._username,
@@ -68,31 +68,31 @@ class SSHClient:
 
                 # Set up terminal
                 self._client.get_transport().window_size = 2 * 1024 * 1024
-                self._terminal = self._client.invoke_shell(term="vt100")
+                self._terminal = await asyncio.to_thread(self._client.invoke_shell, term="vt100")
 
                 # Initialize gpascii
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
                 response = await self._read_response()
                 await self._send_raw("gpascii -2\r\n")
-                time.sleep(1.0)
+                await asyncio.sleep(1.0)
 
                 response = await self._read_response()
-                logger.debug(f"gpascii response: {response}")
+                logger.debug("gpascii response: {}", response)
 
                 # Handle error case where we need to retry
                 if "Err" in response:
                     logger.warning("gpascii error, retrying after delay")
-                    time.sleep(18)
+                    await asyncio.sleep(18)
                     await self._send_raw("gpascii -2\r\n")
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     response = await self._read_response()
-                    logger.debug(f"gpascii retry response: {response}")
+                    logger.debug("gpascii retry response: {}", response)
 
                 # Test echo
                 if not ("Err" in response):
                     await self._send_raw("echo1\n\r")
                     response = await self._read_response(size=256)
-                    logger.debug(f"echo response: {response}")
+                    logger.debug("echo response: {}", response)
 
                 self._connected = True
                 logger.info(f"Connected to SSH at {self._host}")
@@ -105,7 +105,7 @@ class SSHClient:
                     raise
 
                 logger.warning(f"Connection attempt {attempt} failed, retrying in {self._retry['delay']}s")
-                time.sleep(self._retry["delay"])
+                await asyncio.sleep(self._retry["delay"])
 
     async def disconnect(self) -> None:
         """Disconnect from SSH."""
@@ -181,7 +181,7 @@ class SSHClient:
                 response = response.split("\r\n")
                 response = [msg for msg in response if msg != ""]
                 
-                logger.debug(f"Command '{command}' response: {response}")
+                logger.debug("Command '{}' response: {}", command, response)
                 return response
                 
             except Exception as e:
@@ -238,7 +238,7 @@ class SSHClient:
             if not response or "Error" in str(response):
                 raise RuntimeError(f"Error writing tag '{tag}' = {value} to {self._host}: {response}")
                 
-            logger.debug(f"Wrote tag {tag} = {value}")
+            logger.debug("Wrote tag {} = {}", tag, value)
             
         except Exception as e:
             logger.error(f"Failed to write tag '{tag}' = {value} to {self._host}: {str(e)}")
@@ -3,18 +3,22 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from loguru import logger
 from typing import AsyncGenerator
 
 from mcs.utils.errors import create_error  # noqa: F401 - used in error handlers and endpoints
 from mcs.utils.health import ServiceHealth, HealthStatus, create_error_health
-from mcs.api.communication.endpoints import router as state_router
-from mcs.api.communication.endpoints.equipment import router as equipment_router
-from mcs.api.communication.endpoints.motion import router as motion_router
+from mcs.utils.routing import ETagMiddleware
+from mcs.api.communication.endpoints import router as communication_router
 from mcs.api.communication.communication_service import CommunicationService, load_config
 
+# Pre-encoded bodies for the service control endpoints
+_STARTED = Response(content=b'{"status":"started"}', media_type="application/json")
+_STOPPED = Response(content=b'{"status":"stopped"}', media_type="application/json")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -82,9 +86,17 @@ def create_communication_service() -> FastAPI:
         allow_origins=["*"],  # In production, replace with specific origins
         allow_credentials=True,
         allow_methods=["*"],
-        allow_headers=["*"]
+        allow_headers=["*"],
+        expose_headers=["ETag"]
     )
 
+    # Let polling clients revalidate state reads with If-None-Match
+    app.add_middleware(ETagMiddleware, prefixes=("/equipment", "/motion"))
+
+    # Compress larger responses such as full state reads; level 1 favours CPU over ratio.
+    # Added last so it wraps the ETag middleware, which then hashes the uncompressed body.
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
+
     # Add error handlers
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -95,9 +107,7 @@ def create_communication_service() -> FastAPI:
         )
 
     # Add routers
-    app.include_router(state_router)
-    app.include_router(equipment_router)
-    app.include_router(motion_router)
+    app.include_router(communication_router)
 
     # Create service
     service = CommunicationService(config)
@@ -127,12 +137,12 @@ def create_communication_service() -> FastAPI:
     async def start():
         """Start service."""
         await app.state.service.start()
-        return {"status": "started"}
+        return _STARTED
 
     @app.post("/stop")
     async def stop():
         """Stop service."""
         await app.state.service.stop()
-        return {"status": "stopped"}
+        return _STOPPED
 
     return app
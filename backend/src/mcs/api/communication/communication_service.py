@@ -1,14 +1,18 @@
 """Communication service implementation."""
 
-from typing import Dict, Any
-from datetime import datetime
+from typing import Any, Callable, Dict
+from dataclasses import dataclass
+import time
+from functools import lru_cache
+from graphlib import TopologicalSorter
+import asyncio
 from pathlib import Path
 from fastapi import status
 from loguru import logger
-import json
+from orjson import loads as _json_loads
 
 from mcs.utils.errors import create_error
-from mcs.utils.health import ServiceHealth, ComponentHealth, HealthStatus, create_error_health
+from mcs.utils.health import ServiceHealth, ComponentHealth, HealthStatus
 from mcs.api.communication.services import (
     EquipmentService,
     InternalStateService,
@@ -16,30 +20,135 @@ from mcs.api.communication.services import (
     TagCacheService,
     TagMappingService
 )
-from mcs.api.communication.clients import (
-    MockPLCClient,
-    PLCClient,
-    SSHClient
+
+# Components whose error state marks the whole service as failed
+_CRITICAL_COMPONENTS = ("tag_mapping", "tag_cache", "equipment", "motion", "internal_state")
+
+# Component dependency graph: each component maps to the components it needs
+_DEPENDENCIES = {
+    "tag_mapping": set(),
+    "tag_cache": {"tag_mapping"},
+    "equipment": {"tag_cache"},
+    "motion": {"tag_cache"},
+    "internal_state": {"tag_cache", "tag_mapping"},
+}
+
+
+def _dependency_levels(dependencies: Dict[str, set]) -> tuple:
+    """Group components into levels whose members only depend on earlier levels."""
+    sorter = TopologicalSorter(dependencies)
+    sorter.prepare()
+    levels = []
+    while sorter.is_active():
+        level = sorter.get_ready()
+        levels.append(level)
+        sorter.done(*level)
+    return tuple(levels)
+
+
+# Startup levels in dependency order and teardown levels in reverse; peers run in parallel
+_START_LEVELS = _dependency_levels(_DEPENDENCIES)
+_STOP_LEVELS = _START_LEVELS[::-1]
+
+# Components other services depend on are already running once prepare() completes
+_PREPARE_STARTED = frozenset().union(*_DEPENDENCIES.values())
+
+# Longest a component may take to stop before the stop is reported as failed (seconds)
+_STOP_TIMEOUT = 5.0
+
+# Readiness flags set as each component is created
+_READY_TAG_MAPPING = 1 << 0
+_READY_TAG_CACHE = 1 << 1
+_READY_EQUIPMENT = 1 << 2
+_READY_MOTION = 1 << 3
+_READY_INTERNAL_STATE = 1 << 4
+_READY_ALL = (
+    _READY_TAG_MAPPING | _READY_TAG_CACHE | _READY_EQUIPMENT | _READY_MOTION | _READY_INTERNAL_STATE
+)
+
+# Details for components that exist; ComponentHealth validation copies the dict
+_INITIALIZED_DETAILS = {"is_initialized": True}
+
+# Shared health entries for components that have not been created yet
+_NOT_INITIALIZED = ComponentHealth(
+    status=HealthStatus.ERROR,
+    error="Component not initialized",
+    details={"is_initialized": False}
 )
+_TAG_CACHE_NOT_INITIALIZED = ComponentHealth(
+    status=HealthStatus.ERROR,
+    error="Component not initialized",
+    details={"plc_connected": False}
+)
+
+
+async def _no_health() -> None:
+    """Placeholder probe for components that have not been created."""
+    return None
+
+
+def _summarize_health(health: Any, not_initialized: ComponentHealth, details: Dict[str, Any]) -> ComponentHealth:
+    """Collapse a component health probe result into a critical component entry.
+
+    Args:
+        health: Probe result, None if not created, or the exception it raised
+        not_initialized: Entry to use when the component has not been created
+        details: Details to attach to the entry
+
+    Returns:
+        ComponentHealth: OK or ERROR component health
+    """
+    if health is None:
+        return not_initialized
+    if isinstance(health, BaseException):
+        return ComponentHealth(
+            status=HealthStatus.ERROR,
+            error=f"Health check failed: {str(health)}",
+            details=details
+        )
+    status = health.status
+    if status != HealthStatus.OK:
+        status = HealthStatus.ERROR
+    return ComponentHealth(status=status, error=health.error, details=details)
 
 
 def load_config() -> Dict[str, Any]:
     """Load service configuration.
 
+    The parsed file is cached until its modification time changes, so the
+    returned dictionary is shared between callers and must not be mutated.
+
     Returns:
         Dict[str, Any]: Configuration dictionary
 
     Raises:
         FileNotFoundError: If config file not found
     """
-    config_path = Path("backend/config/communication.json")
+    config_path = Path("backend/config/communication.json").resolve()
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        config = json.load(f)
+    return _load_config_file(config_path, config_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _load_config_file(config_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file, cached per path and modification time."""
+    with open(config_path, "rb") as f:
+        return _json_loads(f.read())
+
 
-    return config
+@dataclass(frozen=True)
+class CommsContext:
+    """Hardware clients and tag mapping shared by the communication components."""
+
+    # Written out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("config", "plc_client", "ssh_client", "tag_mapping")
+
+    config: Dict[str, Any]
+    plc_client: Any
+    ssh_client: Any
+    tag_mapping: TagMappingService
 
 
 class CommunicationService:
@@ -51,9 +160,9 @@ class CommunicationService:
         Args:
             config: Service configuration
         """
-        self._service_name = "communication"
+        self.service_name = "communication"
         self._config = config
-        self._version = config.get("version", "1.0.0")
+        self.version = config.get("version", "1.0.0")
         self._is_running = False
         self._start_time = None
 
@@ -63,18 +172,13 @@ class CommunicationService:
         self._equipment = None
         self._motion = None
         self._internal_state = None
+        self._ready_mask = 0
 
-        logger.info(f"{self._service_name} service initialized")
+        # Called when the service stops, as an insertion-ordered set for constant-time removal
+        self._stop_callbacks: Dict[Callable[[], None], None] = {}
 
-    @property
-    def service_name(self) -> str:
-        """Get service name."""
-        return self._service_name
-
-    @property
-    def version(self) -> str:
-        """Get service version."""
-        return self._version
+        self._log = logger.bind(service=self.service_name)
+        self._log.info("{} service initialized", self.service_name)
 
     @property
     def is_running(self) -> bool:
@@ -84,7 +188,19 @@ class CommunicationService:
     @property
     def uptime(self) -> float:
         """Get service uptime."""
-        return (datetime.now() - self._start_time).total_seconds() if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time is not None else 0.0
+
+    def on_stop(self, callback: Callable[[], None]) -> None:
+        """Register callback called when the service stops.
+
+        Callbacks run before any component is stopped, so holders of component
+        references (such as state websockets) can let go of them.
+        """
+        self._stop_callbacks.setdefault(callback)
+
+    def remove_stop_callback(self, callback: Callable[[], None]) -> None:
+        """Remove stop callback."""
+        self._stop_callbacks.pop(callback, None)
 
     @property
     def equipment(self) -> EquipmentService:
@@ -120,59 +236,75 @@ class CommunicationService:
         3. Basic setup
         """
         try:
-            logger.info(f"Initializing {self.service_name} service...")
-
-            # Create core services
-            self._tag_mapping = TagMappingService(self._config)
-            await self._tag_mapping.initialize()
-
-            # Initialize clients based on force_mock setting
-            force_mock = self._config.get("communication", {}).get("hardware", {}).get("network", {}).get("force_mock", True)
-            if force_mock:
-                logger.info("Using mock PLC client (force_mock=true)")
-                plc_client = MockPLCClient(self._config)
-                # Use the same mock client for SSH tags
-                ssh_client = plc_client
-            else:
-                logger.info("Using real PLC client (force_mock=false)")
-                plc_client = PLCClient(self._config)
-                ssh_client = SSHClient(self._config)
+            self._log.info("Initializing {} service...", self.service_name)
+
+            # Create shared clients and core services
+            context = self._create_context()
+            self._tag_mapping = context.tag_mapping
+            self._ready_mask |= _READY_TAG_MAPPING
 
             # Create remaining services
-            self._tag_cache = TagCacheService(self._config, plc_client, ssh_client, self._tag_mapping)
-            self._equipment = EquipmentService(self._config)
-            self._motion = MotionService(self._config)
-            self._internal_state = InternalStateService(self._config)
+            self._tag_cache = TagCacheService(
+                context.config, context.plc_client, context.ssh_client, context.tag_mapping
+            )
+            self._ready_mask |= _READY_TAG_CACHE
+            self._equipment = EquipmentService(context.config)
+            self._ready_mask |= _READY_EQUIPMENT
+            self._motion = MotionService(context.config)
+            self._ready_mask |= _READY_MOTION
+            self._internal_state = InternalStateService(context.config)
+            self._ready_mask |= _READY_INTERNAL_STATE
 
-            logger.info(f"{self.service_name} service basic initialization complete")
+            self._log.info("{} service basic initialization complete", self.service_name)
 
         except Exception as e:
             error_msg = f"Failed to initialize {self.service_name} service: {str(e)}"
-            logger.error(error_msg)
+            self._log.error(error_msg)
             raise create_error(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 message=error_msg
-            )
+            ) from e
+
+    def _create_context(self) -> CommsContext:
+        """Create the clients selected by the force_mock setting and the tag mapping.
+
+        Returns:
+            CommsContext: Shared resources for the communication components
+        """
+        force_mock = self._config.get("communication", {}).get("hardware", {}).get("network", {}).get("force_mock", True)
+        if force_mock:
+            from mcs.api.communication.clients import MockPLCClient
+
+            self._log.info("Using mock PLC client (force_mock=true)")
+            plc_client = MockPLCClient(self._config)
+            # Use the same mock client for SSH tags
+            ssh_client = plc_client
+        else:
+            from mcs.api.communication.clients import PLCClient, SSHClient
+
+            self._log.info("Using real PLC client (force_mock=false)")
+            plc_client = PLCClient(self._config)
+            ssh_client = SSHClient(self._config)
+
+        return CommsContext(
+            config=self._config,
+            plc_client=plc_client,
+            ssh_client=ssh_client,
+            tag_mapping=TagMappingService(self._config)
+        )
 
     async def prepare(self) -> None:
         """Prepare service for operation.
         
         The prepare method handles operations that require running dependencies:
-        1. Starting core services needed by others
-        2. Initializing dependent services
-        3. Setting up service interconnections
+        1. Setting up service interconnections
+        2. Initializing services in dependency order
+        3. Starting core services needed by others
         """
         try:
-            logger.info(f"Preparing {self.service_name} service...")
-
-            # 1. Initialize and start tag_mapping
-            await self._tag_mapping.start()
+            self._log.info("Preparing {} service...", self.service_name)
 
-            # 2. Initialize and start tag_cache
-            await self._tag_cache.initialize()
-            await self._tag_cache.start()
-
-            # 3. Set up service interconnections
+            # 1. Set up service interconnections
             self._equipment.set_tag_cache(self._tag_cache)
             self._equipment.set_internal_state(self._internal_state)
             self._motion.set_tag_cache(self._tag_cache)
@@ -180,20 +312,29 @@ class CommunicationService:
             self._internal_state.set_tag_cache(self._tag_cache)
             self._internal_state.set_tag_mapping(self._tag_mapping)
 
-            # 4. Initialize remaining services
-            await self._equipment.initialize()
-            await self._motion.initialize()
-            await self._internal_state.initialize()
-
-            logger.info(f"{self.service_name} service preparation complete")
+            # 2. Initialize components level by level, cancelling peers on failure
+            for level in _START_LEVELS:
+                tasks = [asyncio.create_task(self._prepare_component(name)) for name in level]
+                try:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                finally:
+                    # Cancel peers still running after a failure, or if prepare() itself is cancelled
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                for task in tasks:
+                    if not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+
+            self._log.info("{} service preparation complete", self.service_name)
 
         except Exception as e:
             error_msg = f"Failed to prepare {self.service_name} service: {str(e)}"
-            logger.error(error_msg)
+            self._log.error(error_msg)
             raise create_error(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 message=error_msg
-            )
+            ) from e
 
     async def start(self) -> None:
         """Start service operations.
@@ -202,38 +343,36 @@ class CommunicationService:
         1. Starting remaining services
         2. Beginning actual operations
         """
-        try:
-            if self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_409_CONFLICT,
-                    message=f"{self.service_name} service already running"
-                )
-
-            # Ensure services are prepared
-            if not all([self._tag_mapping, self._tag_cache, self._equipment, self._motion, self._internal_state]):
-                logger.info(f"Services need initialization, preparing {self.service_name} service")
-                await self.initialize()
-                await self.prepare()
-
-            # Start remaining services (tag_mapping and tag_cache already running from prepare)
-            await self._equipment.start()
-            await self._motion.start()
-            await self._internal_state.start()
+        if self.is_running:
+            raise create_error(
+                status_code=status.HTTP_409_CONFLICT,
+                message=f"{self.service_name} service already running"
+            )
 
-            # Set main service state
-            self._is_running = True
-            self._start_time = datetime.now()
-            logger.info(f"{self.service_name} service started successfully")
+        # Ensure services are prepared (raises its own service errors)
+        if self._ready_mask != _READY_ALL:
+            self._log.info("Services need initialization, preparing {} service", self.service_name)
+            await self.initialize()
+            await self.prepare()
 
+        try:
+            # Start remaining services level by level (dependencies already running from prepare)
+            for level in _START_LEVELS:
+                pending = [getattr(self, f"_{name}").start() for name in level if name not in _PREPARE_STARTED]
+                if pending:
+                    await asyncio.gather(*pending)
         except Exception as e:
-            self._is_running = False
-            self._start_time = None
             error_msg = f"Failed to start {self.service_name} service: {str(e)}"
-            logger.error(error_msg)
+            self._log.error(error_msg)
             raise create_error(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 message=error_msg
-            )
+            ) from e
+
+        # Set main service state
+        self._is_running = True
+        self._start_time = time.monotonic()
+        self._log.info("{} service started successfully", self.service_name)
 
     async def stop(self) -> None:
         """Stop service components but maintain initialization state.
@@ -243,45 +382,80 @@ class CommunicationService:
         2. Maintains service references but clears initialized state
         3. Allows restart via start() which will reinitialize
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_409_CONFLICT,
-                    message=f"{self.service_name} service not running"
-                )
-
-            # Stop services in reverse dependency order
-            if self._internal_state:
-                await self._internal_state.stop()
-            if self._motion:
-                await self._motion.stop()
-            if self._equipment:
-                await self._equipment.stop()
-            if self._tag_cache:
-                await self._tag_cache.stop()
-            if self._tag_mapping:
-                await self._tag_mapping.stop()
-
-            # Reset service state but maintain references
-            self._is_running = False
-            self._start_time = None
-
-            # Clear initialized state so start() will reinitialize
-            self._tag_mapping = None
-            self._tag_cache = None
-            self._equipment = None
-            self._motion = None
-            self._internal_state = None
+        if not self.is_running:
+            raise create_error(
+                status_code=status.HTTP_409_CONFLICT,
+                message=f"{self.service_name} service not running"
+            )
 
-            logger.info(f"{self.service_name} service stopped")
+        for callback in tuple(self._stop_callbacks):
+            try:
+                callback()
+            except Exception as e:
+                self._log.error("Error in stop callback: {}", e)
 
+        try:
+            # Stop services in reverse dependency order, peers in parallel
+            for level in _STOP_LEVELS:
+                # Let every peer finish, and only move on to the services they depend on
+                # once all of them have stopped
+                results = await asyncio.gather(
+                    *(self._stop_component(name) for name in level),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
         except Exception as e:
             error_msg = f"Failed to stop {self.service_name} service: {str(e)}"
-            logger.error(error_msg)
+            self._log.error(error_msg)
             raise create_error(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 message=error_msg
-            )
+            ) from e
+
+        # Reset service state but maintain references
+        self._is_running = False
+        self._start_time = None
+
+        # Clear initialized state so start() will reinitialize
+        self._ready_mask = 0
+        self._tag_mapping = None
+        self._tag_cache = None
+        self._equipment = None
+        self._motion = None
+        self._internal_state = None
+
+        self._log.info("{} service stopped", self.service_name)
+
+    async def _prepare_component(self, name: str) -> None:
+        """Initialize a component, starting it if other components depend on it.
+
+        Args:
+            name: Component attribute name (without leading underscore)
+        """
+        component = getattr(self, f"_{name}")
+        await component.initialize()
+        if name in _PREPARE_STARTED:
+            await component.start()
+
+    async def _stop_component(self, name: str) -> None:
+        """Stop a single component, giving up after _STOP_TIMEOUT seconds.
+
+        Args:
+            name: Component attribute name (without leading underscore)
+
+        Raises:
+            RuntimeError: If the component did not stop in time; its stop keeps
+                running, so the services it depends on must not be stopped yet
+        """
+        component = getattr(self, f"_{name}")
+        if component is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(component.stop()), timeout=_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"{name} stop timed out after {_STOP_TIMEOUT}s") from None
 
     async def shutdown(self) -> None:
         """Shutdown service and cleanup resources.
@@ -291,92 +465,77 @@ class CommunicationService:
         2. Cleans up resources and references
         3. Requires re-initialization to use again
         """
-        try:
-            # Stop if running
-            if self.is_running:
-                await self.stop()
-            else:
-                # Clear service references even if not running
-                self._internal_state = None
-                self._motion = None
-                self._equipment = None
-                self._tag_cache = None
-                self._tag_mapping = None
-
-            logger.info(f"{self.service_name} service shutdown complete")
+        if self.is_running:
+            # stop() raises its own service errors
+            await self.stop()
+        else:
+            # Clear service references even if not running
+            self._ready_mask = 0
+            self._internal_state = None
+            self._motion = None
+            self._equipment = None
+            self._tag_cache = None
+            self._tag_mapping = None
 
-        except Exception as e:
-            error_msg = f"Failed to shutdown {self.service_name} service: {str(e)}"
-            logger.error(error_msg)
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message=error_msg
-            )
+        self._log.info("{} service shutdown complete", self.service_name)
 
     async def health(self) -> ServiceHealth:
         """Get service health status."""
-        try:
-            # Get health from critical components
-            tag_mapping_health = await self._tag_mapping.health() if self._tag_mapping else None
-            tag_cache_health = await self._tag_cache.health() if self._tag_cache else None
-            equipment_health = await self._equipment.health() if self._equipment else None
-            motion_health = await self._motion.health() if self._motion else None
-            internal_state_health = await self._internal_state.health() if self._internal_state else None
-
-            # Track critical component states
-            components = {}
-            
-            # Tag Mapping (Critical - needed for all operations)
-            components["tag_mapping"] = ComponentHealth(
-                status=HealthStatus.OK if tag_mapping_health and tag_mapping_health.status == HealthStatus.OK else HealthStatus.ERROR,
-                error=tag_mapping_health.error if tag_mapping_health else "Component not initialized",
-                details={"is_initialized": self._tag_mapping is not None}
-            )
-
-            # Tag Cache (Critical - needed for hardware communication)
-            components["tag_cache"] = ComponentHealth(
-                status=HealthStatus.OK if tag_cache_health and tag_cache_health.status == HealthStatus.OK else HealthStatus.ERROR,
-                error=tag_cache_health.error if tag_cache_health else "Component not initialized",
-                details={"plc_connected": tag_cache_health.components["plc_client"].status == HealthStatus.OK if tag_cache_health and "plc_client" in tag_cache_health.components else False}
-            )
-
-            # Equipment (Critical hardware systems)
-            components["equipment"] = ComponentHealth(
-                status=HealthStatus.OK if equipment_health and equipment_health.status == HealthStatus.OK else HealthStatus.ERROR,
-                error=equipment_health.error if equipment_health else "Component not initialized",
-                details={"is_initialized": self._equipment is not None}
-            )
-
-            # Motion (Critical for pattern execution)
-            components["motion"] = ComponentHealth(
-                status=HealthStatus.OK if motion_health and motion_health.status == HealthStatus.OK else HealthStatus.ERROR,
-                error=motion_health.error if motion_health else "Component not initialized",
-                details={"is_initialized": self._motion is not None}
-            )
-
-            # Internal State (Critical for operation)
-            components["internal_state"] = ComponentHealth(
-                status=HealthStatus.OK if internal_state_health and internal_state_health.status == HealthStatus.OK else HealthStatus.ERROR,
-                error=internal_state_health.error if internal_state_health else "Component not initialized",
-                details={"is_initialized": self._internal_state is not None}
-            )
-
-            # Overall status is error if any critical component is in error
-            overall_status = HealthStatus.ERROR if any(
-                c.status == HealthStatus.ERROR for c in components.values()
-            ) else HealthStatus.OK
-
-            return ServiceHealth(
-                status=overall_status,
-                service=self.service_name,
-                version=self.version,
-                is_running=self.is_running,
-                uptime=self.uptime,
-                error=None if overall_status == HealthStatus.OK else "Critical component error",
-                components=components
-            )
-
-        except Exception as e:
-            error_msg = f"Health check failed: {str(e)}"
-            logger.error(error_msg)
-            return create_error_health(self.service_name, self.version, error_msg)
+        ok = HealthStatus.OK
+        err = HealthStatus.ERROR
+        # Probe critical components concurrently
+        (
+            tag_mapping_health,
+            tag_cache_health,
+            equipment_health,
+            motion_health,
+            internal_state_health
+        ) = await asyncio.gather(
+            self._tag_mapping.health() if self._tag_mapping is not None else _no_health(),
+            self._tag_cache.health() if self._tag_cache is not None else _no_health(),
+            self._equipment.health() if self._equipment is not None else _no_health(),
+            self._motion.health() if self._motion is not None else _no_health(),
+            self._internal_state.health() if self._internal_state is not None else _no_health(),
+            return_exceptions=True
+        )
+
+        # Tag cache reports PLC connectivity instead of initialization
+        plc_health = (
+            tag_cache_health.components.get("plc_client")
+            if isinstance(tag_cache_health, ServiceHealth) else None
+        )
+
+        # Track critical component states
+        components = {
+            # Needed for all operations
+            "tag_mapping": _summarize_health(tag_mapping_health, _NOT_INITIALIZED, _INITIALIZED_DETAILS),
+            # Needed for hardware communication
+            "tag_cache": _summarize_health(
+                tag_cache_health,
+                _TAG_CACHE_NOT_INITIALIZED,
+                {"plc_connected": plc_health is not None and plc_health.status == ok}
+            ),
+            # Critical hardware systems
+            "equipment": _summarize_health(equipment_health, _NOT_INITIALIZED, _INITIALIZED_DETAILS),
+            # Critical for pattern execution
+            "motion": _summarize_health(motion_health, _NOT_INITIALIZED, _INITIALIZED_DETAILS),
+            # Critical for operation
+            "internal_state": _summarize_health(internal_state_health, _NOT_INITIALIZED, _INITIALIZED_DETAILS)
+        }
+
+        # Overall status is error if any critical component is in error
+        overall_status = ok
+        for name in _CRITICAL_COMPONENTS:
+            if components[name].status == err:
+                overall_status = err
+                break
+
+        return ServiceHealth(
+            status=overall_status,
+            service=self.service_name,
+            version=self.version,
+            is_running=self.is_running,
+            uptime=self.uptime,
+            error=None if overall_status == ok else "Critical component error",
+            components=components
+        )
@@ -1,7 +1,290 @@
 """Communication API endpoints."""
 
-from fastapi import APIRouter
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Request, WebSocket, WebSocketDisconnect, status
+from loguru import logger
+from pydantic_core import to_json
+from starlette.websockets import WebSocketState
+
+from mcs.utils.errors import create_error
+from mcs.api.communication.endpoints.equipment import router as equipment_router
+from mcs.api.communication.endpoints.motion import router as motion_router
+
+
+# Built once; during an outage every equipment and motion request is rejected with it
+_SERVICE_NOT_RUNNING = create_error(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    message="Service not running"
+)
+
+
+def require_running(request: Request) -> None:
+    """Reject equipment and motion requests while the service is stopped.
+
+    Raises:
+        HTTPException: 503 if the communication service is not running
+    """
+    if not request.app.state.service.is_running:
+        # Drop the previous raise's traceback so it does not accumulate across requests
+        raise _SERVICE_NOT_RUNNING.with_traceback(None)
+
+
+# The running check is applied once per request here, so individual endpoints skip it
+router = APIRouter()
+router.include_router(equipment_router, dependencies=[Depends(require_running)])
+router.include_router(motion_router, dependencies=[Depends(require_running)])
+
+# Frames are sent at most this often per client (30 Hz); changes in between coalesce
+_MIN_SEND_INTERVAL = 1 / 30
+
+# Each stream is sent again in full at least this often, even when idle, so clients can resync (seconds)
+_RESYNC_INTERVAL = 60.0
+
+# Fixed parts of state_update (full state) and state_delta (changed fields) frames; each
+# stream is spliced in as a JSON member
+_FRAME_PREFIX = b'{"type":"state_update","data":{'
+_DELTA_PREFIX = b'{"type":"state_delta","changes":{'
+_FRAME_SUFFIX = b"}}"
+
+# JSON member key per stream, encoded once
+_MEMBER_KEYS = {stream: b'"' + stream.encode() + b'":' for stream in ("equipment", "motion")}
+
+# Last serialized state per stream as (state, member, single-stream frame, flattened fields),
+# shared by all clients receiving the same state object
+_last_dumps: Dict[str, Tuple[Any, bytes, bytes, Dict[str, Any]]] = {}
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested state fields into dotted keys such as ``gas.main_flow_actual``."""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def _dump_state(stream: str, state: Any) -> Tuple[bytes, bytes, Dict[str, Any]]:
+    """Serialize a state model as a ``"stream": {...}`` JSON member.
+
+    Serializes straight to bytes with the model's compiled pydantic-core
+    serializer, skipping the str round trip of ``model_dump_json``, and
+    reuses the previous result for the same object. Every client handed the
+    same state therefore shares one serialization and one complete frame.
+    The flattened fields used for deltas are likewise computed once per
+    state.
+
+    Returns:
+        Tuple[bytes, bytes, Dict[str, Any]]: JSON member, a frame carrying only
+            that member, and the state's fields under dotted keys
+    """
+    last = _last_dumps.get(stream)
+    if last is not None and last[0] is state:
+        return last[1], last[2], last[3]
+    member = _MEMBER_KEYS[stream] + state.__pydantic_serializer__.to_json(state)
+    if last is not None and member == last[1]:
+        # Same content in a new object: keep the previous bytes so each client's
+        # unchanged-state check is an identity hit and no frame is rebuilt
+        member, frame, flat = last[1], last[2], last[3]
+    else:
+        frame = _FRAME_PREFIX + member + _FRAME_SUFFIX
+        flat = _flatten(state.model_dump())
+    _last_dumps[stream] = (state, member, frame, flat)
+    return member, frame, flat
+
+
+class _StateStream:
+    """Per-connection slot holding the latest pending state of one stream.
+
+    Pushing overwrites any state not yet sent and sets the connection's
+    shared signal, so one wakeup collects every stream that changed. The
+    member last sent is remembered so unchanged states are skipped, and its
+    fields so later states can be sent as deltas. The state itself is kept
+    so it can be sent again in full on a resync.
+    """
+
+    __slots__ = ("name", "signal", "pending", "last_state", "last_sent", "last_fields")
+
+    def __init__(self, name: str, signal: asyncio.Event):
+        self.name = name
+        self.signal = signal
+        self.pending: Any = None
+        self.last_state: Any = None
+        self.last_sent: Optional[bytes] = None
+        # None until a full state is sent, and again when a resync is due
+        self.last_fields: Optional[Dict[str, Any]] = None
+
+    def push(self, state: Any) -> None:
+        """Store a state update without blocking, replacing any update still pending."""
+        self.pending = state
+        self.signal.set()
+
+    def resync(self) -> None:
+        """Have the next take() return the latest state in full, even if it was already sent."""
+        self.last_sent = None
+        self.last_fields = None
+        if self.pending is None:
+            self.pending = self.last_state
+
+    def take(self) -> Optional[Tuple[bytes, Optional[bytes]]]:
+        """Collect the pending state.
+
+        Returns:
+            Optional[Tuple[bytes, Optional[bytes]]]: Full member and its single-stream
+                frame, or a member holding only the changed fields and None for the
+                frame. None if nothing is pending or the member matches what was last sent.
+        """
+        state = self.pending
+        if state is None:
+            return None
+        self.pending = None
+        self.last_state = state
+        member, frame, fields = _dump_state(self.name, state)
+        if member == self.last_sent:
+            return None
+        last_fields = self.last_fields
+        self.last_sent = member
+        self.last_fields = fields
+        if last_fields is None:
+            return member, frame
+        changes = {key: value for key, value in fields.items() if last_fields.get(key) != value}
+        return _MEMBER_KEYS[self.name] + to_json(changes), None
+
+
+@router.websocket("/state/ws")
+async def websocket_state(websocket: WebSocket):
+    """Stream equipment and motion state updates.
+
+    State changes are buffered latest-wins per stream, and every wakeup
+    sends a single frame carrying whichever streams changed, so a burst of
+    changes costs one send rather than one per change. Sends are capped at
+    30 per second per client however fast the backend changes.
+
+    Each stream is sent in full first and then as deltas of the fields that
+    changed since the client's last frame, with a full state again at
+    least every _RESYNC_INTERVAL seconds.
+
+    The current states are sent right after connecting. The socket is closed
+    with 1001 when the service stops, since the services it subscribes to
+    are replaced on restart.
+    """
+    await websocket.accept()
+
+    service = websocket.app.state.service
+    if not service.is_running:
+        await websocket.close(code=1013, reason="Service not running")
+        return
+
+    equipment = service.equipment
+    motion = service.motion
+    signal = asyncio.Event()
+    equipment_stream = _StateStream("equipment", signal)
+    motion_stream = _StateStream("motion", signal)
+
+    stopped = asyncio.Event()
+
+    # Callbacks fire on the event loop, so the streams can be fed directly
+    equipment.on_state_changed(equipment_stream.push)
+    motion.on_state_changed(motion_stream.push)
+    service.on_stop(stopped.set)
+
+    # Clients only listen; reading lets a close be noticed without waiting for the next send.
+    # Keepalive is left to protocol-level ping frames.
+    receive_task = asyncio.create_task(websocket.receive())
+    signal_task = asyncio.create_task(signal.wait())
+    stopped_task = asyncio.create_task(stopped.wait())
+    loop = asyncio.get_running_loop()
+    resync_at = loop.time() + _RESYNC_INTERVAL
+
+    try:
+        # Start from the current states; a change that arrived while reading is newer, so it wins
+        equipment_state, motion_state = await asyncio.gather(
+            equipment.get_equipment_state(),
+            motion.get_motion_state()
+        )
+        if equipment_stream.pending is None:
+            equipment_stream.push(equipment_state)
+        if motion_stream.pending is None:
+            motion_stream.push(motion_state)
+
+        while True:
+            # Also wake when a resync is due, so idle streams are resent too
+            done, _ = await asyncio.wait(
+                {signal_task, receive_task, stopped_task},
+                timeout=max(resync_at - loop.time(), 0),
+                return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if stopped_task in done:
+                await websocket.close(code=1001, reason="Service stopped")
+                break
+
+            if receive_task in done:
+                if receive_task.result()["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect()
+                # Client messages carry nothing for this stream
+                receive_task = asyncio.create_task(websocket.receive())
+
+            if loop.time() >= resync_at:
+                # Send each stream's latest state in full, whether or not it changed
+                equipment_stream.resync()
+                motion_stream.resync()
+                resync_at = loop.time() + _RESYNC_INTERVAL
+            elif signal_task not in done:
+                continue
+
+            if signal_task in done:
+                signal.clear()
+                signal_task = asyncio.create_task(signal.wait())
+
+            # Send the pending states; bursts have already collapsed into the latest one
+            dumps = [
+                dump
+                for stream in (equipment_stream, motion_stream)
+                if (dump := stream.take()) is not None
+            ]
+
+            if not dumps:
+                continue
+
+            next_send = loop.time() + _MIN_SEND_INTERVAL
+
+            # A lone full stream reuses the frame shared by all clients; others are built here
+            if len(dumps) == 1 and dumps[0][1] is not None:
+                await websocket.send_bytes(dumps[0][1])
+            else:
+                full = [member for member, frame in dumps if frame is not None]
+                changes = [member for member, frame in dumps if frame is None]
+                if full:
+                    await websocket.send_bytes(_FRAME_PREFIX + b",".join(full) + _FRAME_SUFFIX)
+                if changes:
+                    await websocket.send_bytes(_DELTA_PREFIX + b",".join(changes) + _FRAME_SUFFIX)
+
+            # Hold off until the interval has passed; updates meanwhile collapse to the latest
+            delay = next_send - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    except WebSocketDisconnect:
+        logger.info("State websocket client disconnected")
+    except Exception as e:
+        logger.error("State websocket error: {}", e)
+        # Close with an internal error code if neither side has closed yet
+        if (
+            websocket.application_state == WebSocketState.CONNECTED
+            and websocket.client_state == WebSocketState.CONNECTED
+        ):
+            await websocket.close(code=1011, reason="Internal error")
+    finally:
+        signal_task.cancel()
+        receive_task.cancel()
+        stopped_task.cancel()
+        equipment.remove_state_callback(equipment_stream.push)
+        motion.remove_state_changed_callback(motion_stream.push)
+        service.remove_stop_callback(stopped.set)
 
-router = APIRouter(tags=["communication"])
 
 __all__ = ["router"]
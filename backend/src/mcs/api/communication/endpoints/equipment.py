@@ -1,15 +1,18 @@
 """Equipment control endpoints."""
 
-from typing import Literal
-from fastapi import APIRouter, Request, status, Path, Depends
-from loguru import logger
+from typing import Annotated, Any, Awaitable, Callable
+from fastapi import APIRouter, Request, Response, status, Path, Depends, Query
+from orjson import dumps as _json_dumps
 
-from mcs.utils.errors import create_error
+from mcs.utils.errors import create_error, handle_errors
+from mcs.utils.routing import FastJSONRoute
 from mcs.api.communication.services.equipment import EquipmentService
+from mcs.api.communication.services.internal_state import InternalStateService
 from mcs.api.communication.models.state import (
     EquipmentState,
     FeederState,
-    DeagglomeratorState
+    DeagglomeratorState,
+    PeripheralsState
 )
 from mcs.api.communication.models.equipment import (
     GasFlowRequest,
@@ -24,302 +27,256 @@ from mcs.api.communication.models.equipment import (
 )
 
 
-router = APIRouter(prefix="/equipment", tags=["equipment"])
+router = APIRouter(prefix="/equipment", tags=["equipment"], route_class=FastJSONRoute)
+
+# Empty response shared by all setter endpoints
+NO_CONTENT = Response(status_code=status.HTTP_204_NO_CONTENT)
+
+# Pre-encoded boolean bodies for internal state lookups
+_TRUE = Response(content=b"true", media_type="application/json")
+_FALSE = Response(content=b"false", media_type="application/json")
+
+
+def get_equipment(request: Request) -> EquipmentService:
+    """Resolve the equipment service.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        EquipmentService: Equipment service
+    """
+    return request.app.state.service.equipment
+
+
+def get_internal_state(request: Request) -> InternalStateService:
+    """Resolve the internal state service.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        InternalStateService: Internal state service
+    """
+    return request.app.state.service.internal_state
+
+
+def _toggle_endpoint(
+    name: str,
+    doc: str,
+    request_model: type,
+    field: str,
+    method: str,
+    message: str
+) -> Callable[..., Awaitable[Any]]:
+    """Build a setter endpoint that passes one boolean request field to the equipment service.
+
+    Args:
+        name: Endpoint function name (used for the route name and operation ID)
+        doc: Endpoint docstring
+        request_model: Request body model
+        field: Boolean field of the request body to pass on
+        method: Equipment service method to call
+        message: Error message prefix
+
+    Returns:
+        Callable: Endpoint coroutine function
+    """
+    async def endpoint(equipment: Annotated[EquipmentService, Depends(get_equipment)], body: request_model):
+        await getattr(equipment, method)(getattr(body, field))
+        return NO_CONTENT
+
+    endpoint.__name__ = endpoint.__qualname__ = name
+    endpoint.__doc__ = doc
+    return handle_errors(message)(endpoint)
 
 
 @router.get("/state", response_model=EquipmentState)
-async def get_state(request: Request) -> EquipmentState:
+@handle_errors("Failed to get equipment state")
+async def get_state(
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    fresh: bool = Query(False, description="Bypass the short-lived state cache")
+) -> EquipmentState:
     """Get current equipment state."""
-    try:
-        service = request.app.state.service
-        if not service.is_running:
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message="Service not running"
-            )
-
-        state = await service.equipment.get_equipment_state()
-        return state
-
-    except Exception as e:
-        error_msg = "Failed to get equipment state"
-        logger.error(f"{error_msg}: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=error_msg
-        )
+    return await equipment.get_equipment_state(fresh)
 
 
 @router.get("/internal_states/{state_name}", response_model=bool)
-async def get_equipment_internal_state(request: Request, state_name: str) -> bool:
+@handle_errors("Failed to get equipment internal state {state_name}")
+async def get_equipment_internal_state(
+    internal_state: Annotated[InternalStateService, Depends(get_internal_state)],
+    state_name: str
+) -> Response:
     """Get single equipment-related internal state."""
-    try:
-        service = request.app.state.service
-        if not service.is_running:
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message="Service not running"
-            )
-
-        state = await service.internal_state.get_equipment_state(state_name)
-        if state is None:
-            raise create_error(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message=f"State '{state_name}' not found"
-            )
-            
-        return state
-
-    except Exception as e:
-        error_msg = f"Failed to get equipment internal state {state_name}"
-        logger.error(f"{error_msg}: {str(e)}")
+    state = await internal_state.get_equipment_state(state_name)
+    if state is None:
         raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=error_msg
+            status_code=status.HTTP_404_NOT_FOUND,
+            message=f"State '{state_name}' not found"
         )
 
+    return _TRUE if state else _FALSE
+
 
 @router.get("/feeders/{feeder_id}", response_model=FeederState)
+@handle_errors("Failed to get feeder {feeder_id} state")
 async def get_feeder_state(
-    feeder_id: int = Path(..., description="ID of feeder to get state for (1 or 2)"),
-    equipment_service: EquipmentService = Depends()
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    feeder_id: int = Path(..., ge=1, le=2, description="ID of feeder to get state for (1 or 2)")
 ) -> FeederState:
     """Get state of specific feeder."""
-    return await equipment_service.get_feeder_state(feeder_id)
+    return await equipment.get_feeder_state(feeder_id)
 
 
 @router.get("/deagglomerators/{deagg_id}", response_model=DeagglomeratorState)
+@handle_errors("Failed to get deagglomerator {deagg_id} state")
 async def get_deagglomerator_state(
-    deagg_id: int = Path(..., description="ID of deagglomerator to get state for (1 or 2)"),
-    equipment_service: EquipmentService = Depends()
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    deagg_id: int = Path(..., ge=1, le=2, description="ID of deagglomerator to get state for (1 or 2)")
 ) -> DeagglomeratorState:
     """Get state of specific deagglomerator."""
-    return await equipment_service.get_deagglomerator_state(deagg_id)
+    return await equipment.get_deagglomerator_state(deagg_id)
+
+
+@router.get("/peripherals", response_model=PeripheralsState)
+@handle_errors("Failed to get peripherals state")
+async def get_peripherals_state(
+    equipment: Annotated[EquipmentService, Depends(get_equipment)]
+) -> PeripheralsState:
+    """Get all feeder and deagglomerator states in one response.
+
+    Preferred over polling each feeder and deagglomerator separately.
+    """
+    return await equipment.get_peripherals_state()
 
 
 @router.get("/gas/main/flow")
-async def get_main_flow(request: Request):
+@handle_errors("Failed to get main flow")
+async def get_main_flow(
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    fresh: bool = Query(False, description="Bypass the short-lived state cache")
+) -> Response:
     """Get main gas flow state."""
-    try:
-        gas_state = await request.app.state.service.equipment.get_gas_state()
-        return {
+    gas_state = await equipment.get_gas_state(fresh)
+    return Response(
+        content=_json_dumps({
             "setpoint": gas_state.main_flow_setpoint,
             "actual": gas_state.main_flow_actual
-        }
-    except Exception as e:
-        logger.error(f"Failed to get main flow: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to get main flow: {str(e)}"
-        )
+        }),
+        media_type="application/json"
+    )
 
 
 @router.get("/gas/feeder/flow")
-async def get_feeder_flow(request: Request):
+@handle_errors("Failed to get feeder flow")
+async def get_feeder_flow(
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    fresh: bool = Query(False, description="Bypass the short-lived state cache")
+) -> Response:
     """Get feeder gas flow state."""
-    try:
-        gas_state = await request.app.state.service.equipment.get_gas_state()
-        return {
+    gas_state = await equipment.get_gas_state(fresh)
+    return Response(
+        content=_json_dumps({
             "setpoint": gas_state.feeder_flow_setpoint,
             "actual": gas_state.feeder_flow_actual
-        }
-    except Exception as e:
-        logger.error(f"Failed to get feeder flow: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to get feeder flow: {str(e)}"
-        )
+        }),
+        media_type="application/json"
+    )
 
 
-@router.put("/gas/main/flow")
-async def set_main_gas_flow(request: Request, flow: GasFlowRequest):
+@router.put("/gas/main/flow", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to set main gas flow")
+async def set_main_gas_flow(equipment: Annotated[EquipmentService, Depends(get_equipment)], flow: GasFlowRequest):
     """Set main gas flow."""
-    try:
-        await request.app.state.service.equipment.set_main_gas_flow(flow.flow)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set main gas flow: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set main gas flow: {str(e)}"
-        )
+    await equipment.set_main_flow_setpoint(flow.flow_setpoint)
+    return NO_CONTENT
 
 
-@router.put("/gas/feeder/flow")
-async def set_feeder_gas_flow(request: Request, flow: GasFlowRequest):
+@router.put("/gas/feeder/flow", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to set feeder gas flow")
+async def set_feeder_gas_flow(equipment: Annotated[EquipmentService, Depends(get_equipment)], flow: GasFlowRequest):
     """Set feeder gas flow."""
-    try:
-        await request.app.state.service.equipment.set_feeder_gas_flow(flow.flow)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set feeder gas flow: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set feeder gas flow: {str(e)}"
-        )
+    await equipment.set_feeder_flow_setpoint(flow.flow_setpoint)
+    return NO_CONTENT
 
 
-@router.put("/gas/main/valve")
-async def set_main_gas_valve(request: Request, valve: GasValveRequest):
-    """Set main gas valve state."""
-    try:
-        await request.app.state.service.equipment.set_main_gas_valve(valve.open)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set main gas valve: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set main gas valve: {str(e)}"
-        )
+router.put("/gas/main/valve", status_code=status.HTTP_204_NO_CONTENT)(_toggle_endpoint(
+    "set_main_gas_valve", "Set main gas valve state.", GasValveRequest, "open", "set_main_gas_valve_state", "Failed to set main gas valve"
+))
 
 
-@router.put("/gas/feeder/valve")
-async def set_feeder_gas_valve(request: Request, valve: GasValveRequest):
-    """Set feeder gas valve state."""
-    try:
-        await request.app.state.service.equipment.set_feeder_gas_valve(valve.open)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set feeder gas valve: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set feeder gas valve: {str(e)}"
-        )
+router.put("/gas/feeder/valve", status_code=status.HTTP_204_NO_CONTENT)(_toggle_endpoint(
+    "set_feeder_gas_valve", "Set feeder gas valve state.", GasValveRequest, "open", "set_feeder_gas_valve_state", "Failed to set feeder gas valve"
+))
 
 
-@router.put("/vacuum/gate_valve")
-async def set_gate_valve(request: Request, valve: GateValveRequest):
+@router.put("/vacuum/gate_valve", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to set gate valve")
+async def set_gate_valve(equipment: Annotated[EquipmentService, Depends(get_equipment)], valve: GateValveRequest):
     """Set gate valve state."""
-    try:
-        await request.app.state.service.equipment.set_gate_valve(valve.open, valve.partial)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set gate valve: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set gate valve: {str(e)}"
-        )
+    await equipment.set_gate_valve_state(valve.position == "open")
+    return NO_CONTENT
 
 
-@router.put("/vacuum/vent_valve")
-async def set_vent_valve(request: Request, valve: GasValveRequest):
-    """Set vent valve state."""
-    try:
-        await request.app.state.service.equipment.set_vent_valve(valve.open)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set vent valve: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set vent valve: {str(e)}"
-        )
+router.put("/vacuum/vent_valve", status_code=status.HTTP_204_NO_CONTENT)(_toggle_endpoint(
+    "set_vent_valve", "Set vent valve state.", GasValveRequest, "open", "set_vent_valve_state", "Failed to set vent valve"
+))
 
 
-@router.put("/vacuum/mechanical_pump/state")
-async def set_mech_pump_state(request: Request, pump: VacuumPumpRequest):
-    """Set mechanical pump state."""
-    try:
-        await request.app.state.service.equipment.set_mechanical_pump_state(pump.start)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set mechanical pump state: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set mechanical pump state: {str(e)}"
-        )
+router.put("/vacuum/mechanical_pump/state", status_code=status.HTTP_204_NO_CONTENT)(_toggle_endpoint(
+    "set_mech_pump_state", "Set mechanical pump state.", VacuumPumpRequest, "start", "set_mechanical_pump_state", "Failed to set mechanical pump state"
+))
 
 
-@router.put("/vacuum/booster_pump/state")
-async def set_booster_pump_state(request: Request, pump: VacuumPumpRequest):
-    """Set booster pump state."""
-    try:
-        await request.app.state.service.equipment.set_booster_pump_state(pump.start)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set booster pump state: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set booster pump state: {str(e)}"
-        )
+router.put("/vacuum/booster_pump/state", status_code=status.HTTP_204_NO_CONTENT)(_toggle_endpoint(
+    "set_booster_pump_state", "Set booster pump state.", VacuumPumpRequest, "start", "set_booster_pump_state", "Failed to set booster pump state"
+))
 
 
-@router.put("/feeder/{feeder_id}/state")
+@router.put("/feeder/{feeder_id}/state", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to set feeder {feeder_id} state")
 async def set_feeder_state(
-    request: Request,
-    feeder_id: Literal[1, 2],
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    feeder_id: Annotated[int, Path(ge=1, le=2, description="ID of feeder (1 or 2)")],
     state: FeederStateRequest
 ):
     """Set feeder running state."""
-    try:
-        await request.app.state.service.equipment.set_feeder_state(feeder_id, state.running)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set feeder {feeder_id} state: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set feeder {feeder_id} state: {str(e)}"
-        )
+    await equipment.set_feeder_state(feeder_id, state.running)
+    return NO_CONTENT
 
 
-@router.put("/feeder/{feeder_id}/frequency")
+@router.put("/feeder/{feeder_id}/frequency", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to set feeder {feeder_id} frequency")
 async def set_feeder_frequency(
-    request: Request,
-    feeder_id: Literal[1, 2],
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    feeder_id: Annotated[int, Path(ge=1, le=2, description="ID of feeder (1 or 2)")],
     feeder: FeederRequest
 ):
     """Set feeder frequency."""
-    try:
-        await request.app.state.service.equipment.set_feeder_frequency(feeder_id, feeder.frequency)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set feeder {feeder_id} frequency: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set feeder {feeder_id} frequency: {str(e)}"
-        )
+    await equipment.set_feeder_frequency(feeder_id, feeder.frequency)
+    return NO_CONTENT
 
 
-@router.put("/deagglomerator/{deagg_id}/duty_cycle")
+@router.put("/deagglomerator/{deagg_id}/duty_cycle", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to set deagglomerator {deagg_id} duty cycle")
 async def set_deagglomerator_duty_cycle(
-    request: Request,
-    deagg_id: Literal[1, 2],
+    equipment: Annotated[EquipmentService, Depends(get_equipment)],
+    deagg_id: Annotated[int, Path(ge=1, le=2, description="ID of deagglomerator (1 or 2)")],
     deagg: DeagglomeratorRequest
 ):
     """Set deagglomerator duty cycle."""
-    try:
-        await request.app.state.service.equipment.set_deagglomerator_duty_cycle(deagg_id, deagg.duty_cycle)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set deagglomerator {deagg_id} duty cycle: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set deagglomerator {deagg_id} duty cycle: {str(e)}"
-        )
+    await equipment.set_deagglomerator_duty_cycle(deagg_id, deagg.duty_cycle)
+    return NO_CONTENT
 
 
-@router.put("/nozzle/select")
-async def select_nozzle(request: Request, nozzle: NozzleSelectRequest):
+@router.put("/nozzle/select", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to select nozzle")
+async def select_nozzle(equipment: Annotated[EquipmentService, Depends(get_equipment)], nozzle: NozzleSelectRequest):
     """Select active nozzle."""
-    try:
-        await request.app.state.service.equipment.select_nozzle(nozzle.nozzle)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to select nozzle: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to select nozzle: {str(e)}"
-        )
+    await equipment.set_nozzle_state(nozzle.nozzle_id)
+    return NO_CONTENT
 
 
-@router.put("/nozzle/shutter")
-async def set_shutter_state(request: Request, shutter: ShutterRequest):
-    """Set shutter state."""
-    try:
-        await request.app.state.service.equipment.set_shutter_state(shutter.open)
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"Failed to set shutter state: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=f"Failed to set shutter state: {str(e)}"
-        )
+router.put("/nozzle/shutter", status_code=status.HTTP_204_NO_CONTENT)(_toggle_endpoint(
+    "set_shutter_state", "Set shutter state.", ShutterRequest, "open", "set_shutter_state", "Failed to set shutter state"
+))
@@ -1,106 +1,70 @@
 """Motion control endpoints."""
 
-from fastapi import APIRouter, Request, status
-from loguru import logger
+from typing import Annotated
 
-from mcs.utils.errors import create_error
-from mcs.api.communication.models.motion import (
-    MotionState,
-    Position,
-    MoveRequest,
-    MotionStatus
-)
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from mcs.utils.errors import handle_errors
+from mcs.utils.routing import FastJSONRoute
+from mcs.api.communication.services.motion import MotionService
+from mcs.api.communication.models.state import MotionState, Position, SystemStatus
+from mcs.api.communication.models.motion import MoveRequest
 
-router = APIRouter(prefix="/motion", tags=["motion"])
+
+router = APIRouter(prefix="/motion", tags=["motion"], route_class=FastJSONRoute)
+
+# Empty response shared by all command endpoints
+NO_CONTENT = Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def get_motion(request: Request) -> MotionService:
+    """Resolve the motion service.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        MotionService: Motion service
+    """
+    return request.app.state.service.motion
 
 
 @router.get("/state", response_model=MotionState)
-async def get_motion_state(request: Request) -> MotionState:
+@handle_errors("Failed to get motion state")
+async def get_motion_state(
+    motion: Annotated[MotionService, Depends(get_motion)],
+    fresh: bool = Query(False, description="Bypass the short-lived state cache")
+) -> MotionState:
     """Get current motion state."""
-    try:
-        service = request.app.state.service
-        if not service.is_running:
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message="Service not running"
-            )
-            
-        state = await service.motion.get_motion_state()
-        return state
-        
-    except Exception as e:
-        error_msg = "Failed to get motion state"
-        logger.error(f"{error_msg}: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=error_msg
-        )
+    return await motion.get_motion_state(fresh)
 
 
 @router.get("/position", response_model=Position)
-async def get_position(request: Request) -> Position:
+@handle_errors("Failed to get position")
+async def get_position(
+    motion: Annotated[MotionService, Depends(get_motion)],
+    fresh: bool = Query(False, description="Bypass the short-lived state cache")
+) -> Position:
     """Get current position."""
-    try:
-        service = request.app.state.service
-        if not service.is_running:
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message="Service not running"
-            )
-            
-        position = await service.motion.get_position()
-        return position
-        
-    except Exception as e:
-        error_msg = "Failed to get position"
-        logger.error(f"{error_msg}: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=error_msg
-        )
-
-
-@router.get("/status", response_model=MotionStatus)
-async def get_status(request: Request) -> MotionStatus:
+    return await motion.get_position(fresh)
+
+
+@router.get("/status", response_model=SystemStatus)
+@handle_errors("Failed to get motion status")
+async def get_status(
+    motion: Annotated[MotionService, Depends(get_motion)],
+    fresh: bool = Query(False, description="Bypass the short-lived state cache")
+) -> SystemStatus:
     """Get motion system status."""
-    try:
-        service = request.app.state.service
-        if not service.is_running:
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message="Service not running"
-            )
-            
-        motion_status = await service.motion.get_status()
-        return motion_status
-        
-    except Exception as e:
-        error_msg = "Failed to get motion status"
-        logger.error(f"{error_msg}: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=error_msg
-        )
-
-
-@router.post("/move", response_model=None)
-async def move_to_position(request: Request, move_request: MoveRequest) -> None:
+    return await motion.get_status(fresh)
+
+
+@router.post("/move", status_code=status.HTTP_204_NO_CONTENT)
+@handle_errors("Failed to move to position")
+async def move_to_position(
+    motion: Annotated[MotionService, Depends(get_motion)],
+    move_request: MoveRequest
+) -> Response:
     """Move to position."""
-    try:
-        service = request.app.state.service
-        if not service.is_running:
-            raise create_error(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                message="Service not running"
-            )
-            
-        await service.motion.move_to_position(move_request)
-        
-    except Exception as e:
-        error_msg = "Failed to move to position"
-        logger.error(f"{error_msg}: {str(e)}")
-        raise create_error(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=error_msg
-        )
+    await motion.move(move_request.x, move_request.y, move_request.z, move_request.velocity)
+    return NO_CONTENT
@@ -22,6 +22,7 @@ from .state import (
     VacuumState,
     FeederState,
     NozzleState,
+    PeripheralsState,
     Position,
     AxisStatus,
     SystemStatus,
@@ -52,6 +53,7 @@ __all__ = [
     'VacuumState',
     'FeederState',
     'NozzleState',
+    'PeripheralsState',
     'Position',
     'AxisStatus',
     'SystemStatus',
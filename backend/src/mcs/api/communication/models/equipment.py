@@ -1,5 +1,7 @@
 """Equipment state and request models."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -21,7 +23,7 @@ class VacuumPumpRequest(BaseModel):
 
 class GateValveRequest(BaseModel):
     """Request model for setting gate valve state."""
-    position: str = Field(..., description="Valve position: 'open' or 'closed'")
+    position: Literal["open", "closed"] = Field(..., description="Valve position: 'open' or 'closed'")
 
 
 class ShutterRequest(BaseModel):
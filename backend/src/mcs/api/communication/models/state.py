@@ -1,3 +1,5 @@
+from typing import Dict
+
 from pydantic import BaseModel, Field
 
 
@@ -44,6 +46,12 @@ class DeagglomeratorState(BaseModel):
     duty_cycle: float = Field(..., description="Duty cycle percentage")
 
 
+class PeripheralsState(BaseModel):
+    """All feeder and deagglomerator states, keyed by ID."""
+    feeders: Dict[int, FeederState] = Field(..., description="Feeder states by feeder ID")
+    deagglomerators: Dict[int, DeagglomeratorState] = Field(..., description="Deagglomerator states by ID")
+
+
 class PressureState(BaseModel):
     """System pressure state model."""
     chamber: float = Field(..., description="Chamber pressure in Torr")
@@ -1,10 +1,10 @@
 """Equipment service implementation."""
 
-from typing import Dict, Any, Callable
-from datetime import datetime
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Sequence, Set, Tuple
 from fastapi import status
 from loguru import logger
 import asyncio
+import time
 
 from mcs.utils.errors import create_error
 from mcs.utils.health import ServiceHealth, ComponentHealth, HealthStatus, create_error_health
@@ -13,25 +13,152 @@ from mcs.api.communication.services.internal_state import InternalStateService
 from mcs.api.communication.models.state import (
     GasState, VacuumState, EquipmentState, FeederState,
     NozzleState, DeagglomeratorState, PressureState, HardwareState,
-    ProcessState
+    ProcessState, PeripheralsState
 )
 
 
+# Readings younger than this are reused for state queries (seconds)
+_STATE_TTL = 0.05
+
+# Default age up to which a health report is reused (seconds); see "health_ttl" in config
+_HEALTH_TTL = 2.0
+
+# Shared component health entries, indexed by whether the dependency is running
+_TAG_CACHE_HEALTH = {
+    True: ComponentHealth(status=HealthStatus.OK),
+    False: ComponentHealth(status=HealthStatus.ERROR, error="Tag cache service not running")
+}
+_INTERNAL_STATE_HEALTH = {
+    True: ComponentHealth(status=HealthStatus.OK),
+    False: ComponentHealth(status=HealthStatus.ERROR, error="Internal state service not running")
+}
+
+# Feeders, deagglomerators and nozzles come in pairs numbered 1 and 2
+_UNIT_IDS = frozenset((1, 2))
+
+# Tags making up GasState, in field order
+_GAS_TAGS = [
+    "gas_control.main_flow.setpoint",
+    "gas_control.main_flow.measured",
+    "gas_control.feeder_flow.setpoint",
+    "gas_control.feeder_flow.measured",
+    "gas_control.main_valve.open",
+    "gas_control.feeder_valve.open"
+]
+
+# Tags making up each EquipmentState branch, in the order _read_equipment_state unpacks them
+_VACUUM_TAGS = [
+    "pressure.chamber",
+    "vacuum.gate_valve.open",
+    "vacuum.mechanical_pump.start",  # wrong, need state this is a momentary tag to start the pump
+    "vacuum.booster_pump.start",  # wrong, need state this is a momentary tag to start the pump
+    "vacuum.vent_valve"
+]
+_FEEDER_TAGS = [
+    "feeders.feeder1.running",  # wrong, set as bool but its an integer 4 for off 1 for on
+    "feeders.feeder2.running",  # wrong, set as bool but its an integer 4 for off 1 for on
+    "feeders.feeder1.frequency",
+    "feeders.feeder2.frequency"
+]
+_DEAGG_TAGS = [
+    "deagglomerators.deagg1.duty_cycle",
+    "deagglomerators.deagg2.duty_cycle"
+]
+_NOZZLE_TAGS = [
+    "nozzle.select",
+    "nozzle.shutter.open"
+]
+_PRESSURE_TAGS = [
+    "pressure.chamber",
+    "pressure.feeder",
+    "pressure.main_supply",
+    "pressure.nozzle",
+    "pressure.regulator"
+]
+
+# Tags making up PeripheralsState, in the order get_peripherals_state unpacks them
+_PERIPHERAL_TAGS = [
+    "feeders.feeder1.running",
+    "feeders.feeder1.frequency",
+    "feeders.feeder2.running",
+    "feeders.feeder2.frequency",
+    "deagglomerators.deagg1.duty_cycle",
+    "deagglomerators.deagg2.duty_cycle"
+]
+
+
+def _require_unit_id(kind: str, unit_id: int) -> None:
+    """Raise a 400 error unless unit_id names one of the paired units (1 or 2)."""
+    if unit_id not in _UNIT_IDS:
+        raise create_error(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=f"Invalid {kind} ID: {unit_id}"
+        )
+
+
+def _gas_state(
+    main_flow_setpoint: Any,
+    main_flow_actual: Any,
+    feeder_flow_setpoint: Any,
+    feeder_flow_actual: Any,
+    main_valve_state: Any,
+    feeder_valve_state: Any
+) -> GasState:
+    """Build GasState from _GAS_TAGS values."""
+    return GasState(
+        main_flow_setpoint=main_flow_setpoint,
+        main_flow_actual=main_flow_actual,
+        feeder_flow_setpoint=feeder_flow_setpoint,
+        feeder_flow_actual=feeder_flow_actual,
+        main_valve_state=main_valve_state,
+        feeder_valve_state=feeder_valve_state
+    )
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """Mark a write's failure as retrieved, in case its caller was cancelled while waiting."""
+    if not future.cancelled():
+        future.exception()
+
+
 class EquipmentService:
     """Service for equipment control."""
 
     def __init__(self, config: Dict[str, Any]):
         """Initialize service."""
         self._service_name = "equipment"
-        self._version = config.get("communication", {}).get("services", {}).get("equipment", {}).get("version", "1.0.0")
+        service_config = config.get("communication", {}).get("services", {}).get("equipment", {})
+        self._version = service_config.get("version", "1.0.0")
+        self._health_ttl = float(service_config.get("health_ttl", _HEALTH_TTL))
         self._is_running = False
         self._start_time = None
+        self._not_running_message = f"{self._service_name} service not running"
         
         # Initialize components to None
         self._config = config  # Store config here
         self._tag_cache = None
         self._internal_state = None
-        self._state_callbacks = []
+        # Registered callbacks as an insertion-ordered set for constant-time removal
+        self._state_callbacks: Dict[Callable[[EquipmentState], None], None] = {}
+        # Coroutine callbacks still running, referenced so they are not garbage collected
+        self._callback_tasks: Set[asyncio.Task] = set()
+
+        # Recent readings as (monotonic time, state)
+        self._equipment_state_cache = None
+        self._gas_state_cache = None
+        self._health_cache = None
+
+        # In-flight readings shared by concurrent callers, by name
+        self._pending_reads: Dict[str, asyncio.Task] = {}
+
+        # Tag writes waiting for the writer task, in arrival order, as (tag, value, completion future)
+        self._pending_writes: List[Tuple[str, Any, asyncio.Future]] = []
+        self._write_task: Optional[asyncio.Task] = None
+
+        # Last sub-state per EquipmentState branch as (input values, state), and the last
+        # EquipmentState as (branch states, state), reused while their inputs are unchanged
+        self._last_substates: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+        self._last_equipment_state = None
         
         logger.info(f"{self.service_name} service initialized")
 
@@ -50,30 +177,56 @@ class EquipmentService:
         """Get service running state."""
         return self._is_running
 
+    def _require_running(self) -> None:
+        """Raise a 503 error unless the service is running."""
+        if not self._is_running:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message=self._not_running_message
+            )
+
     @property
     def uptime(self) -> float:
         """Get service uptime in seconds."""
-        return (datetime.now() - self._start_time).total_seconds() if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time is not None else 0.0
 
     def on_state_changed(self, callback: Callable[[EquipmentState], None]) -> None:
         """Register callback for equipment state changes."""
-        if callback not in self._state_callbacks:
-            self._state_callbacks.append(callback)
+        self._state_callbacks.setdefault(callback)
 
     def remove_state_callback(self, callback: Callable[[EquipmentState], None]) -> None:
         """Remove state change callback."""
-        if callback in self._state_callbacks:
-            self._state_callbacks.remove(callback)
+        self._state_callbacks.pop(callback, None)
 
     def _handle_state_change(self, state_type: str, state: Any) -> None:
         """Handle state change from tag cache."""
         if state_type == "equipment":
-            # Notify equipment state callbacks
-            for callback in self._state_callbacks:
-                try:
+            self._dispatch_state(state)
+
+    def _dispatch_state(self, state: EquipmentState) -> None:
+        """Hand a state to every registered callback without waiting on any of them.
+
+        Plain callbacks are expected to only buffer the state (the websocket
+        streams keep the latest one per client) and are called directly.
+        Coroutine callbacks are started as tasks, so a slow subscriber delays
+        neither the others nor the tag cache update that produced the state.
+        """
+        for callback in tuple(self._state_callbacks):
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    task = asyncio.create_task(callback(state))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_done)
+                else:
                     callback(state)
-                except Exception as e:
-                    logger.error(f"Error in equipment state callback: {str(e)}")
+            except Exception as e:
+                logger.error("Error in equipment state callback: {}", e)
+
+    def _callback_done(self, task: asyncio.Task) -> None:
+        """Release a finished coroutine callback and log its failure, if any."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error in equipment state callback: {}", task.exception())
 
     def set_tag_cache(self, tag_cache: TagCacheService) -> None:
         """Set tag cache service."""
@@ -127,14 +280,15 @@ class EquipmentService:
                     message=f"{self.service_name} service already running"
                 )
 
-            if not self._tag_cache or not self._internal_state:
+            if self._tag_cache is None or self._internal_state is None:
                 raise create_error(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     message=f"{self.service_name} service not initialized"
                 )
 
             self._is_running = True
-            self._start_time = datetime.now()
+            self._start_time = time.monotonic()
+            self._health_cache = None
             logger.info(f"{self.service_name} service started")
 
         except Exception as e:
@@ -153,11 +307,14 @@ class EquipmentService:
             if not self.is_running:
                 raise create_error(
                     status_code=status.HTTP_409_CONFLICT,
-                    message=f"{self.service_name} service not running"
+                    message=self._not_running_message
                 )
 
             self._is_running = False
             self._start_time = None
+            self._equipment_state_cache = None
+            self._gas_state_cache = None
+            self._health_cache = None
             logger.info(f"{self.service_name} service stopped")
 
         except Exception as e:
@@ -171,23 +328,12 @@ class EquipmentService:
     async def _get_component_health(self) -> Dict[str, ComponentHealth]:
         """Get health status of all components."""
         try:
-            components = {}
-            
-            # Check tag cache service
-            tag_cache_ok = self._tag_cache and self._tag_cache.is_running
-            components["tag_cache"] = ComponentHealth(
-                status=HealthStatus.OK if tag_cache_ok else HealthStatus.ERROR,
-                error=None if tag_cache_ok else "Tag cache service not running"
-            )
-
-            # Check internal state service
-            internal_state_ok = self._internal_state and self._internal_state.is_running
-            components["internal_state"] = ComponentHealth(
-                status=HealthStatus.OK if internal_state_ok else HealthStatus.ERROR,
-                error=None if internal_state_ok else "Internal state service not running"
-            )
-
-            return components
+            tag_cache_ok = self._tag_cache is not None and self._tag_cache.is_running
+            internal_state_ok = self._internal_state is not None and self._internal_state.is_running
+            return {
+                "tag_cache": _TAG_CACHE_HEALTH[tag_cache_ok],
+                "internal_state": _INTERNAL_STATE_HEALTH[internal_state_ok]
+            }
 
         except Exception as e:
             logger.error(f"Failed to get component health: {str(e)}")
@@ -199,7 +345,15 @@ class EquipmentService:
             }
 
     async def health(self) -> ServiceHealth:
-        """Get service health status."""
+        """Get service health status.
+
+        Reports younger than the configured health TTL are reused, so
+        frequent health polling does not rebuild them. A reused report is
+        copied with the current uptime.
+        """
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < self._health_ttl:
+            return cached[1].model_copy(update={"uptime": self.uptime})
         try:
             components = await self._get_component_health()
             
@@ -208,7 +362,7 @@ class EquipmentService:
                 c.status == HealthStatus.ERROR for c in components.values()
             ) else HealthStatus.OK
 
-            return ServiceHealth(
+            health = ServiceHealth(
                 status=overall_status,
                 service=self.service_name,
                 version=self.version,
@@ -217,20 +371,72 @@ class EquipmentService:
                 error="Critical component failure" if overall_status == HealthStatus.ERROR else None,
                 components=components
             )
+            # Stamped after the checks complete so the entry is not aged by their duration
+            self._health_cache = (time.monotonic(), health)
+            return health
             
         except Exception as e:
             error_msg = f"Health check failed: {str(e)}"
             logger.error(error_msg)
             return create_error_health(self.service_name, self.version, error_msg)
 
-    async def get_equipment_state(self) -> EquipmentState:
-        """Get current equipment state."""
+    async def get_equipment_state(self, fresh: bool = False) -> EquipmentState:
+        """Get current equipment state, reusing a reading younger than _STATE_TTL unless fresh."""
+        cached = self._equipment_state_cache
+        if not fresh and cached is not None and time.monotonic() - cached[0] < _STATE_TTL:
+            return cached[1]
+        state = await self._shared_read("equipment", self._read_equipment_state, fresh)
+        self._equipment_state_cache = (time.monotonic(), state)
+        return state
+
+    async def _shared_read(self, name: str, read: Callable[[], Awaitable[Any]], fresh: bool = False) -> Any:
+        """Run a reading once for all concurrent callers asking for it.
+
+        Args:
+            name: Reading name
+            read: Coroutine function performing the reading
+            fresh: Start a new reading instead of joining one already in flight,
+                which may have begun before the caller's last change
+
+        Returns:
+            Any: Result of the shared reading
+        """
+        task = None if fresh else self._pending_reads.get(name)
+        if task is None:
+            task = asyncio.create_task(read())
+            self._pending_reads[name] = task
+            task.add_done_callback(lambda done: self._read_done(name, done))
+        # Shield so one cancelled caller does not cancel the reading for the others
+        return await asyncio.shield(task)
+
+    def _read_done(self, name: str, task: asyncio.Task) -> None:
+        """Forget a finished reading unless a newer one has replaced it."""
+        if self._pending_reads.get(name) is task:
+            del self._pending_reads[name]
+
+    def _substate(self, branch: str, values: Sequence[Any], build: Callable[..., Any]) -> Any:
+        """Build an EquipmentState branch, reusing the previous one if its inputs are unchanged.
+
+        Args:
+            branch: Branch name
+            values: Tag and internal state values the branch is built from
+            build: Builds the branch from the values, in order
+
+        Returns:
+            Any: Branch state model
+        """
+        values = tuple(values)
+        last = self._last_substates.get(branch)
+        if last is not None and last[0] == values:
+            return last[1]
+        state = build(*values)
+        self._last_substates[branch] = (values, state)
+        return state
+
+    async def _read_equipment_state(self) -> EquipmentState:
+        """Read current equipment state from the tag cache and internal states."""
         try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+            self._require_running()
 
             if not self._tag_cache or not self._tag_cache.is_running:
                 raise create_error(
@@ -246,15 +452,16 @@ class EquipmentService:
 
             # Get vacuum state
             try:
-                chamber_pressure = await self._tag_cache.get_tag("pressure.chamber")
-                logger.debug(f"Chamber pressure from tag cache: {chamber_pressure}")
-                
-                vacuum_state = VacuumState(
-                    chamber_pressure=chamber_pressure,
-                    gate_valve_state=await self._tag_cache.get_tag("vacuum.gate_valve.open"),
-                    mechanical_pump_state=await self._tag_cache.get_tag("vacuum.mechanical_pump.start"),  # wrong, need state this is a momentary tag to start the pump
-                    booster_pump_state=await self._tag_cache.get_tag("vacuum.booster_pump.start"),  # wrong, need state this is a momentary tag to start the pump
-                    vent_valve_state=await self._tag_cache.get_tag("vacuum.vent_valve")
+                vacuum_state = self._substate(
+                    "vacuum",
+                    await self._tag_cache.get_tags(_VACUUM_TAGS),
+                    lambda chamber_pressure, gate_valve, mechanical_pump, booster_pump, vent_valve: VacuumState(
+                        chamber_pressure=chamber_pressure,
+                        gate_valve_state=gate_valve,
+                        mechanical_pump_state=mechanical_pump,
+                        booster_pump_state=booster_pump,
+                        vent_valve_state=vent_valve
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get vacuum state: {str(e)}")
@@ -262,29 +469,20 @@ class EquipmentService:
 
             # Get gas state
             try:
-                gas_state = GasState(
-                    main_flow_setpoint=await self._tag_cache.get_tag("gas_control.main_flow.setpoint"),
-                    main_flow_actual=await self._tag_cache.get_tag("gas_control.main_flow.measured"),
-                    feeder_flow_setpoint=await self._tag_cache.get_tag("gas_control.feeder_flow.setpoint"),
-                    feeder_flow_actual=await self._tag_cache.get_tag("gas_control.feeder_flow.measured"),
-                    main_valve_state=await self._tag_cache.get_tag("gas_control.main_valve.open"),
-                    feeder_valve_state=await self._tag_cache.get_tag("gas_control.feeder_valve.open")
-                )
+                gas_state = self._substate("gas", await self._tag_cache.get_tags(_GAS_TAGS), _gas_state)
             except Exception as e:
                 logger.error(f"Failed to get gas state: {str(e)}")
                 raise
 
             # Get feeder state
             try:
-                # Try feeder1 first, then feeder2
-                feeder1_running = await self._tag_cache.get_tag("feeders.feeder1.running")  # wrong, set as bool but its an integer 4 for off 1 for on
-                feeder2_running = await self._tag_cache.get_tag("feeders.feeder2.running")  # wrong, set as bool but its an integer 4 for off 1 for on
-                feeder1_freq = await self._tag_cache.get_tag("feeders.feeder1.frequency")
-                feeder2_freq = await self._tag_cache.get_tag("feeders.feeder2.frequency")
-                
-                feeder_state = FeederState(
-                    running=feeder1_running or feeder2_running,  # True if either feeder is running
-                    frequency=feeder1_freq if feeder1_running else feeder2_freq  # Use frequency of active feeder
+                feeder_state = self._substate(
+                    "feeder",
+                    await self._tag_cache.get_tags(_FEEDER_TAGS),
+                    lambda feeder1_running, feeder2_running, feeder1_freq, feeder2_freq: FeederState(
+                        running=feeder1_running or feeder2_running,  # True if either feeder is running
+                        frequency=feeder1_freq if feeder1_running else feeder2_freq  # Use frequency of active feeder
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get feeder state: {str(e)}")
@@ -292,12 +490,13 @@ class EquipmentService:
 
             # Get deagglomerator state
             try:
-                # Try deagg1 first, then deagg2
-                deagg1_duty = await self._tag_cache.get_tag("deagglomerators.deagg1.duty_cycle")
-                deagg2_duty = await self._tag_cache.get_tag("deagglomerators.deagg2.duty_cycle")
-                
-                deagg_state = DeagglomeratorState(
-                    duty_cycle=deagg1_duty if deagg1_duty is not None else deagg2_duty
+                # Use deagg1 if set, otherwise deagg2
+                deagg_state = self._substate(
+                    "deagglomerator",
+                    await self._tag_cache.get_tags(_DEAGG_TAGS),
+                    lambda deagg1_duty, deagg2_duty: DeagglomeratorState(
+                        duty_cycle=deagg1_duty if deagg1_duty is not None else deagg2_duty
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get deagglomerator state: {str(e)}")
@@ -305,9 +504,13 @@ class EquipmentService:
 
             # Get nozzle state
             try:
-                nozzle_state = NozzleState(
-                    active_nozzle=1 if not await self._tag_cache.get_tag("nozzle.select") else 2,
-                    shutter_state=await self._tag_cache.get_tag("nozzle.shutter.open")
+                nozzle_state = self._substate(
+                    "nozzle",
+                    await self._tag_cache.get_tags(_NOZZLE_TAGS),
+                    lambda select, shutter_open: NozzleState(
+                        active_nozzle=1 if not select else 2,
+                        shutter_state=shutter_open
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get nozzle state: {str(e)}")
@@ -315,12 +518,16 @@ class EquipmentService:
 
             # Get pressure state
             try:
-                pressure_state = PressureState(
-                    chamber=await self._tag_cache.get_tag("pressure.chamber"),
-                    feeder=await self._tag_cache.get_tag("pressure.feeder"),
-                    main_supply=await self._tag_cache.get_tag("pressure.main_supply"),
-                    nozzle=await self._tag_cache.get_tag("pressure.nozzle"),
-                    regulator=await self._tag_cache.get_tag("pressure.regulator")
+                pressure_state = self._substate(
+                    "pressure",
+                    await self._tag_cache.get_tags(_PRESSURE_TAGS),
+                    lambda chamber, feeder, main_supply, nozzle, regulator: PressureState(
+                        chamber=chamber,
+                        feeder=feeder,
+                        main_supply=main_supply,
+                        nozzle=nozzle,
+                        regulator=regulator
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get pressure state: {str(e)}")
@@ -328,10 +535,18 @@ class EquipmentService:
 
             # Get hardware state from internal state service
             try:
-                hardware_state = HardwareState(
-                    motion_enabled=await self._internal_state.get_state("motion_enabled"),
-                    plc_connected=self._tag_cache._plc_client.is_connected(),
-                    position_valid=await self._internal_state.get_state("at_valid_position")
+                hardware_state = self._substate(
+                    "hardware",
+                    (
+                        await self._internal_state.get_state("motion_enabled"),
+                        self._tag_cache._plc_client.is_connected(),
+                        await self._internal_state.get_state("at_valid_position")
+                    ),
+                    lambda motion_enabled, plc_connected, position_valid: HardwareState(
+                        motion_enabled=motion_enabled,
+                        plc_connected=plc_connected,
+                        position_valid=position_valid
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get hardware state: {str(e)}")
@@ -339,16 +554,34 @@ class EquipmentService:
 
             # Get process state from internal state service
             try:
-                process_state = ProcessState(
-                    gas_flow_stable=await self._internal_state.get_state("flows_stable"),  # I don't think we are actually checking the time average of the flow rates
-                    powder_feed_active=await self._internal_state.get_state("powder_feed_on"),
-                    process_ready=await self._internal_state.get_state("pressures_stable")  # I don't think we are actually checking the time average of the pressures
+                process_state = self._substate(
+                    "process",
+                    (
+                        await self._internal_state.get_state("flows_stable"),  # I don't think we are actually checking the time average of the flow rates
+                        await self._internal_state.get_state("powder_feed_on"),
+                        await self._internal_state.get_state("pressures_stable")  # I don't think we are actually checking the time average of the pressures
+                    ),
+                    lambda gas_flow_stable, powder_feed_active, process_ready: ProcessState(
+                        gas_flow_stable=gas_flow_stable,
+                        powder_feed_active=powder_feed_active,
+                        process_ready=process_ready
+                    )
                 )
             except Exception as e:
                 logger.error(f"Failed to get process state: {str(e)}")
                 raise
 
-            return EquipmentState(
+            # An unchanged reading returns the previous object, so consumers keyed on identity
+            # (such as the websocket serialization cache) skip their work
+            branches = (
+                gas_state, vacuum_state, feeder_state, deagg_state,
+                nozzle_state, pressure_state, hardware_state, process_state
+            )
+            last = self._last_equipment_state
+            if last is not None and all(branch is previous for branch, previous in zip(branches, last[0])):
+                return last[1]
+
+            state = EquipmentState.model_construct(
                 gas=gas_state,
                 vacuum=vacuum_state,
                 feeder=feeder_state,
@@ -358,6 +591,8 @@ class EquipmentService:
                 hardware=hardware_state,
                 process=process_state
             )
+            self._last_equipment_state = (branches, state)
+            return state
 
         except Exception as e:
             error_msg = "Failed to get equipment state"
@@ -367,26 +602,23 @@ class EquipmentService:
                 message=error_msg
             )
 
-    async def get_gas_state(self) -> GasState:
-        """Get gas system state."""
+    async def get_gas_state(self, fresh: bool = False) -> GasState:
+        """Get gas system state, reusing a reading younger than _STATE_TTL unless fresh."""
+        cached = self._gas_state_cache
+        if not fresh and cached is not None and time.monotonic() - cached[0] < _STATE_TTL:
+            return cached[1]
+        gas_state = await self._shared_read("gas", self._read_gas_state, fresh)
+        self._gas_state_cache = (time.monotonic(), gas_state)
+        return gas_state
+
+    async def _read_gas_state(self) -> GasState:
+        """Read gas system state from the tag cache."""
         try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+            self._require_running()
 
             # Get gas state from individual tags
             try:
-                gas_state = GasState(
-                    main_flow_setpoint=await self._tag_cache.get_tag("gas_control.main_flow.setpoint"),
-                    main_flow_actual=await self._tag_cache.get_tag("gas_control.main_flow.measured"),
-                    feeder_flow_setpoint=await self._tag_cache.get_tag("gas_control.feeder_flow.setpoint"),
-                    feeder_flow_actual=await self._tag_cache.get_tag("gas_control.feeder_flow.measured"),
-                    main_valve_state=await self._tag_cache.get_tag("gas_control.main_valve.open"),
-                    feeder_valve_state=await self._tag_cache.get_tag("gas_control.feeder_valve.open")
-                )
-                return gas_state
+                return self._substate("gas", await self._tag_cache.get_tags(_GAS_TAGS), _gas_state)
             except Exception as e:
                 logger.error(f"Failed to get gas state: {str(e)}")
                 raise create_error(
@@ -405,11 +637,7 @@ class EquipmentService:
     async def get_vacuum_state(self) -> VacuumState:
         """Get vacuum system state."""
         try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+            self._require_running()
 
             # Get vacuum state from individual tags
             try:
@@ -436,47 +664,44 @@ class EquipmentService:
                 message=error_msg
             )
 
-    async def set_main_flow_setpoint(self, flow_setpoint: float) -> None:
-        """Set main gas flow setpoint."""
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+    async def _set_tag(self, tag: str, value: Any, action: str, log_message: str, *log_args: Any) -> None:
+        """Write one equipment tag on behalf of a setter.
 
-            await self._tag_cache.set_tag("gas_control.main_flow.setpoint", flow_setpoint)
-            logger.info(f"Set main gas flow setpoint to {flow_setpoint} SLPM")
-            await self._notify_state_changed()
+        Args:
+            tag: Internal tag name
+            value: Value to write
+            action: What is being set, used in the error message (e.g. "shutter state")
+            log_message: Info message logged after the write, formatted with log_args
+
+        Raises:
+            HTTPException: 500 if the service is not running or the write fails
+        """
+        try:
+            self._require_running()
+            await self._write_tag(tag, value)
+            logger.info(log_message, *log_args)
 
         except Exception as e:
-            error_msg = "Failed to set main flow setpoint"
+            error_msg = f"Failed to set {action}"
             logger.error(f"{error_msg}: {str(e)}")
             raise create_error(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=error_msg
             )
 
+    async def set_main_flow_setpoint(self, flow_setpoint: float) -> None:
+        """Set main gas flow setpoint."""
+        await self._set_tag(
+            "gas_control.main_flow.setpoint", flow_setpoint, "main flow setpoint",
+            "Set main gas flow setpoint to {} SLPM", flow_setpoint
+        )
+
     async def set_feeder_flow_setpoint(self, flow_setpoint: float) -> None:
         """Set feeder gas flow setpoint."""
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("gas_control.feeder_flow.setpoint", flow_setpoint)
-            logger.info(f"Set feeder gas flow setpoint to {flow_setpoint} SLPM")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set feeder flow setpoint"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "gas_control.feeder_flow.setpoint", flow_setpoint, "feeder flow setpoint",
+            "Set feeder gas flow setpoint to {} SLPM", flow_setpoint
+        )
 
     async def set_main_gas_valve_state(self, open: bool) -> None:
         """Set main gas valve state.
@@ -484,24 +709,10 @@ class EquipmentService:
         Args:
             open: True to open valve, False to close
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("gas_control.main_valve.open", open)
-            logger.info(f"Set main gas valve state to {'open' if open else 'closed'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set main gas valve state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "gas_control.main_valve.open", open, "main gas valve state",
+            "Set main gas valve state to {}", "open" if open else "closed"
+        )
 
     async def set_feeder_gas_valve_state(self, open: bool) -> None:
         """Set feeder gas valve state.
@@ -509,24 +720,10 @@ class EquipmentService:
         Args:
             open: True to open valve, False to close
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("gas_control.feeder_valve.open", open)
-            logger.info(f"Set feeder gas valve state to {'open' if open else 'closed'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set feeder gas valve state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "gas_control.feeder_valve.open", open, "feeder gas valve state",
+            "Set feeder gas valve state to {}", "open" if open else "closed"
+        )
 
     async def set_gate_valve_state(self, open: bool) -> None:
         """Set vacuum gate valve state.
@@ -534,24 +731,10 @@ class EquipmentService:
         Args:
             open: True to open valve, False to close
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("vacuum.gate_valve.open", open)
-            logger.info(f"Set vacuum gate valve state to {'open' if open else 'closed'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set gate valve state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "vacuum.gate_valve.open", open, "gate valve state",
+            "Set vacuum gate valve state to {}", "open" if open else "closed"
+        )
 
     async def set_vent_valve_state(self, open: bool) -> None:
         """Set vacuum vent valve state.
@@ -559,24 +742,10 @@ class EquipmentService:
         Args:
             open: True to open valve, False to close
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("vacuum.vent_valve", open)
-            logger.info(f"Set vacuum vent valve state to {'open' if open else 'closed'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set vent valve state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "vacuum.vent_valve", open, "vent valve state",
+            "Set vacuum vent valve state to {}", "open" if open else "closed"
+        )
 
     async def set_mechanical_pump_state(self, running: bool) -> None:
         """Set mechanical pump state.
@@ -584,24 +753,10 @@ class EquipmentService:
         Args:
             running: True to start pump, False to stop
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("vacuum.mechanical_pump.start", running)
-            logger.info(f"Set mechanical pump state to {'running' if running else 'stopped'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set mechanical pump state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "vacuum.mechanical_pump.start", running, "mechanical pump state",
+            "Set mechanical pump state to {}", "running" if running else "stopped"
+        )
 
     async def set_booster_pump_state(self, running: bool) -> None:
         """Set booster pump state.
@@ -609,24 +764,10 @@ class EquipmentService:
         Args:
             running: True to start pump, False to stop
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("vacuum.booster_pump.start", running)
-            logger.info(f"Set booster pump state to {'running' if running else 'stopped'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set booster pump state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "vacuum.booster_pump.start", running, "booster pump state",
+            "Set booster pump state to {}", "running" if running else "stopped"
+        )
 
     async def set_feeder_frequency(self, feeder_id: int, frequency: float) -> None:
         """Set feeder frequency setpoint.
@@ -635,31 +776,11 @@ class EquipmentService:
             feeder_id: ID of feeder to control (1 or 2)
             frequency: Operating frequency in Hz
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            # Validate feeder ID
-            if feeder_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid feeder ID: {feeder_id}"
-                )
-
-            await self._tag_cache.set_tag(f"feeders.feeder{feeder_id}.frequency", frequency)
-            logger.info(f"Set feeder {feeder_id} frequency to {frequency} Hz")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = f"Failed to set feeder {feeder_id} frequency"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        _require_unit_id("feeder", feeder_id)
+        await self._set_tag(
+            f"feeders.feeder{feeder_id}.frequency", frequency, f"feeder {feeder_id} frequency",
+            "Set feeder {} frequency to {} Hz", feeder_id, frequency
+        )
 
     async def set_feeder_state(self, feeder_id: int, running: bool) -> None:
         """Set feeder running state.
@@ -668,31 +789,11 @@ class EquipmentService:
             feeder_id: ID of feeder to control (1 or 2)
             running: True to start feeder, False to stop
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            # Validate feeder ID
-            if feeder_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid feeder ID: {feeder_id}"
-                )
-
-            await self._tag_cache.set_tag(f"feeders.feeder{feeder_id}.running", running)
-            logger.info(f"Set feeder {feeder_id} state to {'running' if running else 'stopped'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = f"Failed to set feeder {feeder_id} state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        _require_unit_id("feeder", feeder_id)
+        await self._set_tag(
+            f"feeders.feeder{feeder_id}.running", running, f"feeder {feeder_id} state",
+            "Set feeder {} state to {}", feeder_id, "running" if running else "stopped"
+        )
 
     async def set_nozzle_state(self, nozzle_id: int) -> None:
         """Set active nozzle state.
@@ -700,31 +801,11 @@ class EquipmentService:
         Args:
             nozzle_id: ID of nozzle to select (1 or 2)
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            # Validate nozzle ID
-            if nozzle_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid nozzle ID: {nozzle_id}"
-                )
-
-            await self._tag_cache.set_tag("nozzle.select", nozzle_id == 2)
-            logger.info(f"Set active nozzle state to nozzle {nozzle_id}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set nozzle state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        _require_unit_id("nozzle", nozzle_id)
+        await self._set_tag(
+            "nozzle.select", nozzle_id == 2, "nozzle state",
+            "Set active nozzle state to nozzle {}", nozzle_id
+        )
 
     async def set_shutter_state(self, open: bool) -> None:
         """Set nozzle shutter state.
@@ -732,24 +813,10 @@ class EquipmentService:
         Args:
             open: True to open shutter, False to close
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            await self._tag_cache.set_tag("nozzle.shutter.open", open)
-            logger.info(f"Set nozzle shutter state to {'open' if open else 'closed'}")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = "Failed to set shutter state"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        await self._set_tag(
+            "nozzle.shutter.open", open, "shutter state",
+            "Set nozzle shutter state to {}", "open" if open else "closed"
+        )
 
     async def set_deagglomerator_duty_cycle(self, deagg_id: int, duty_cycle: float) -> None:
         """Set deagglomerator duty cycle setpoint.
@@ -758,38 +825,17 @@ class EquipmentService:
             deagg_id: ID of deagglomerator to control (1 or 2)
             duty_cycle: Duty cycle in percent (0-100)
         """
-        try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
-
-            # Validate deagglomerator ID
-            if deagg_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid deagglomerator ID: {deagg_id}"
-                )
-
-            # Validate duty cycle
-            if not 0 <= duty_cycle <= 100:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid duty cycle: {duty_cycle}, must be between 0 and 100"
-                )
-
-            await self._tag_cache.set_tag(f"deagglomerators.deagg{deagg_id}.duty_cycle", duty_cycle)
-            logger.info(f"Set deagglomerator {deagg_id} duty cycle to {duty_cycle}%")
-            await self._notify_state_changed()
-
-        except Exception as e:
-            error_msg = f"Failed to set deagglomerator {deagg_id} duty cycle"
-            logger.error(f"{error_msg}: {str(e)}")
+        _require_unit_id("deagglomerator", deagg_id)
+        if not 0 <= duty_cycle <= 100:
             raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"Invalid duty cycle: {duty_cycle}, must be between 0 and 100"
             )
+        await self._set_tag(
+            f"deagglomerators.deagg{deagg_id}.duty_cycle", duty_cycle,
+            f"deagglomerator {deagg_id} duty cycle",
+            "Set deagglomerator {} duty cycle to {}%", deagg_id, duty_cycle
+        )
 
     async def set_deagglomerator_frequency(self, deagg_id: int, frequency: float) -> None:
         """Set deagglomerator frequency setpoint.
@@ -798,46 +844,93 @@ class EquipmentService:
             deagg_id: ID of deagglomerator to control (1 or 2)
             frequency: Operating frequency in Hz
         """
+        _require_unit_id("deagglomerator", deagg_id)
+        await self._set_tag(
+            f"deagglomerators.deagg{deagg_id}.frequency", frequency, f"deagglomerator {deagg_id} frequency",
+            "Set deagglomerator {} frequency to {} Hz", deagg_id, frequency
+        )
+
+    async def _notify_state_changed(self) -> None:
+        """Notify subscribers that equipment state has changed."""
         try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+            # Take a fresh reading and refresh the query caches with it
+            state = await self._read_equipment_state()
+            now = time.monotonic()
+            self._equipment_state_cache = (now, state)
+            self._gas_state_cache = (now, state.gas)
+            self._health_cache = None
+            self._dispatch_state(state)
+        except Exception as e:
+            logger.error("Error notifying state change: {}", e)
 
-            # Validate deagglomerator ID
-            if deagg_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid deagglomerator ID: {deagg_id}"
-                )
+    async def _write_tag(self, tag: str, value: Any) -> None:
+        """Write a tag through the shared writer.
 
-            await self._tag_cache.set_tag(f"deagglomerators.deagg{deagg_id}.frequency", frequency)
-            logger.info(f"Set deagglomerator {deagg_id} frequency to {frequency} Hz")
-            await self._notify_state_changed()
+        Writes are queued and sent one by one in arrival order. Every write
+        reaches the PLC, including repeated writes to the same tag such as
+        pulses on momentary tags. Writes that queue up while a batch is being
+        sent form the next batch. Each batch is followed by a single state
+        notification instead of one per write. The first write after an idle
+        period starts immediately, so there is no added delay.
 
-        except Exception as e:
-            error_msg = f"Failed to set deagglomerator {deagg_id} frequency"
-            logger.error(f"{error_msg}: {str(e)}")
-            raise create_error(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=error_msg
-            )
+        Args:
+            tag: Internal tag name
+            value: Value to write
 
-    async def _notify_state_changed(self) -> None:
-        """Notify subscribers that equipment state has changed."""
+        Raises:
+            HTTPException: If the write fails
+            RuntimeError: If the writer stopped before the write completed
+        """
+        done = asyncio.get_running_loop().create_future()
+        done.add_done_callback(_retrieve_exception)
+        self._pending_writes.append((tag, value, done))
+        if self._write_task is None:
+            self._write_task = asyncio.create_task(self._flush_writes())
+        # Shield so a cancelled caller does not cancel the write itself
+        await asyncio.shield(done)
+
+    async def _flush_writes(self) -> None:
+        """Send queued writes batch by batch until none are left.
+
+        Callers are released as soon as their batch is written, before the
+        batch's state notification. Cached and in-flight state readings are
+        dropped first, so a state query made after a write returns reflects it.
+        """
+        batch: List[Tuple[str, Any, asyncio.Future]] = []
+        written: List[asyncio.Future] = []
         try:
-            state = await self.get_equipment_state()
-            for callback in self._state_callbacks:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(state)
+            while self._pending_writes:
+                batch = self._pending_writes
+                self._pending_writes = []
+                for tag, value, done in batch:
+                    try:
+                        await self._tag_cache.set_tag(tag, value)
+                    except Exception as e:
+                        done.set_exception(e)
                     else:
-                        callback(state)
-                except Exception as e:
-                    logger.error(f"Error in state callback: {str(e)}")
-        except Exception as e:
-            logger.error(f"Error notifying state change: {str(e)}")
+                        written.append(done)
+                if not written:
+                    continue
+                self._equipment_state_cache = None
+                self._gas_state_cache = None
+                self._pending_reads.pop("equipment", None)
+                self._pending_reads.pop("gas", None)
+                for done in written:
+                    done.set_result(None)
+                written = []
+                await self._notify_state_changed()
+        finally:
+            self._write_task = None
+            # If the writer was cancelled, settle every caller still waiting: writes
+            # already sent succeeded, the rest did not complete
+            for done in written:
+                if not done.done():
+                    done.set_result(None)
+            unsent = [entry[2] for entry in batch] + [entry[2] for entry in self._pending_writes]
+            self._pending_writes = []
+            for done in unsent:
+                if not done.done():
+                    done.set_exception(RuntimeError("Equipment writer stopped before the write completed"))
 
     async def get_feeder_state(self, feeder_id: int) -> FeederState:
         """Get state of specific feeder.
@@ -849,18 +942,9 @@ class EquipmentService:
             FeederState: Current feeder state
         """
         try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+            self._require_running()
 
-            # Validate feeder ID
-            if feeder_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid feeder ID: {feeder_id}"
-                )
+            _require_unit_id("feeder", feeder_id)
 
             # Get feeder state from individual tags
             try:
@@ -896,18 +980,9 @@ class EquipmentService:
             DeagglomeratorState: Current deagglomerator state
         """
         try:
-            if not self.is_running:
-                raise create_error(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    message=f"{self.service_name} service not running"
-                )
+            self._require_running()
 
-            # Validate deagglomerator ID
-            if deagg_id not in [1, 2]:
-                raise create_error(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    message=f"Invalid deagglomerator ID: {deagg_id}"
-                )
+            _require_unit_id("deagglomerator", deagg_id)
 
             # Get deagglomerator state from individual tags
             try:
@@ -930,3 +1005,38 @@ class EquipmentService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=error_msg
             )
+
+    async def get_peripherals_state(self) -> PeripheralsState:
+        """Get state of all feeders and deagglomerators.
+
+        Returns:
+            PeripheralsState: Current feeder and deagglomerator states
+        """
+        try:
+            self._require_running()
+
+            # Read every peripheral tag in one call
+            (
+                feeder1_running, feeder1_frequency,
+                feeder2_running, feeder2_frequency,
+                deagg1_duty_cycle, deagg2_duty_cycle
+            ) = await self._tag_cache.get_tags(_PERIPHERAL_TAGS)
+
+            return PeripheralsState(
+                feeders={
+                    1: FeederState(running=feeder1_running, frequency=feeder1_frequency),
+                    2: FeederState(running=feeder2_running, frequency=feeder2_frequency)
+                },
+                deagglomerators={
+                    1: DeagglomeratorState(duty_cycle=deagg1_duty_cycle),
+                    2: DeagglomeratorState(duty_cycle=deagg2_duty_cycle)
+                }
+            )
+
+        except Exception as e:
+            error_msg = "Failed to get peripherals state"
+            logger.error("{}: {}", error_msg, e)
+            raise create_error(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                message=error_msg
+            )
@@ -1,13 +1,23 @@
 """Internal state evaluation service."""
 
 from typing import Dict, Any, Optional, Callable
-from datetime import datetime
+from operator import eq, ge, gt, le, lt
+import time
 from loguru import logger
 from fastapi import status
+import asyncio
 
 from mcs.utils.errors import create_error
 from mcs.utils.health import ServiceHealth, ComponentHealth, HealthStatus, create_error_health
 
+# Comparison operators usable in state rules; rules without a known operator compare for equality
+_COMPARISONS = {
+    "greater_than": gt,
+    "less_than": lt,
+    "greater_than_equal": ge,
+    "less_than_equal": le
+}
+
 
 class InternalStateService:
     """Service for evaluating internal states from PLC tags."""
@@ -37,9 +47,13 @@ class InternalStateService:
         self._tag_cache = None
         self._tag_mapping = None
         
-        # Add callback lists
-        self._equipment_state_callbacks = []
-        self._motion_state_callbacks = []
+        # Registered callbacks as insertion-ordered sets for constant-time removal
+        self._equipment_state_callbacks: Dict[Callable[[Dict[str, bool]], None], None] = {}
+        self._motion_state_callbacks: Dict[Callable[[Dict[str, bool]], None], None] = {}
+
+        # Tag updates only mark states stale; one worker re-evaluates them per wakeup
+        self._tags_updated = asyncio.Event()
+        self._update_task: Optional[asyncio.Task] = None
         
         logger.info(f"{self.service_name} service initialized")
         
@@ -61,7 +75,7 @@ class InternalStateService:
     @property
     def uptime(self) -> float:
         """Get service uptime in seconds."""
-        return (datetime.now() - self._start_time).total_seconds() if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time is not None else 0.0
 
     def set_tag_cache(self, tag_cache_service: Any) -> None:
         """Set tag cache service.
@@ -138,10 +152,13 @@ class InternalStateService:
                 return
                 
             self._is_running = True
-            self._start_time = datetime.now()
+            self._start_time = time.monotonic()
             
             # Initialize internal states
             await self._evaluate_all_states()
+
+            self._tags_updated.clear()
+            self._update_task = asyncio.create_task(self._process_tag_updates())
             
             logger.info(f"{self.service_name} service started")
             
@@ -165,6 +182,14 @@ class InternalStateService:
             # Unsubscribe from tag cache
             if self._tag_cache:
                 await self._tag_cache.unsubscribe(self._on_tag_update)
+
+            if self._update_task:
+                self._update_task.cancel()
+                try:
+                    await self._update_task
+                except asyncio.CancelledError:
+                    pass
+                self._update_task = None
             
             self._is_running = False
             self._start_time = None
@@ -231,27 +256,40 @@ class InternalStateService:
             logger.error(error_msg)
             return create_error_health(self.service_name, self.version, error_msg)
 
-    async def _on_tag_update(self, tag: str, value: Any) -> None:
+    def _on_tag_update(self, tag: str, value: Any) -> None:
         """Handle tag update from tag cache.
         
         Args:
             tag: Updated tag name
             value: New tag value
         """
-        # Re-evaluate states and notify callbacks if values changed
-        old_equipment_states = await self.get_equipment_states()
-        old_motion_states = await self.get_motion_states()
-        
-        await self._evaluate_all_states()
-        
-        new_equipment_states = await self.get_equipment_states()
-        new_motion_states = await self.get_motion_states()
-        
-        if new_equipment_states != old_equipment_states:
-            await self._notify_equipment_state_callbacks()
-            
-        if new_motion_states != old_motion_states:
-            await self._notify_motion_state_callbacks()
+        # Every state is re-evaluated from current tags, so updates only need to wake the worker
+        self._tags_updated.set()
+
+    async def _process_tag_updates(self) -> None:
+        """Re-evaluate states after tag updates and notify callbacks if values changed.
+
+        Updates arriving during an evaluation are coalesced into the next pass.
+        """
+        while True:
+            await self._tags_updated.wait()
+            self._tags_updated.clear()
+            try:
+                old_equipment_states = await self.get_equipment_states()
+                old_motion_states = await self.get_motion_states()
+
+                await self._evaluate_all_states()
+
+                new_equipment_states = await self.get_equipment_states()
+                new_motion_states = await self.get_motion_states()
+
+                if new_equipment_states != old_equipment_states:
+                    await self._notify_equipment_state_callbacks()
+
+                if new_motion_states != old_motion_states:
+                    await self._notify_motion_state_callbacks()
+            except Exception as e:
+                logger.error(f"Error re-evaluating internal states: {str(e)}")
 
     def _tag_affects_rule(self, tag: str, rule: Dict[str, Any]) -> bool:
         """Check if tag affects a state rule.
@@ -331,7 +369,7 @@ class InternalStateService:
             if resolved is None:
                 logger.warning(f"Could not resolve placeholder {value} - tag {tag} not found")
                 return None
-            logger.debug(f"Resolved placeholder {value} -> {resolved}")
+            logger.debug("Resolved placeholder {} -> {}", value, resolved)
             return resolved
         return value
 
@@ -370,20 +408,11 @@ class InternalStateService:
                     self._internal_states[state] = False
                     return
                     
-                operator = rule.get("operator", "equal")
-                if operator == "greater_than":
-                    new_value = tag_value > compare_value
-                elif operator == "less_than":
-                    new_value = tag_value < compare_value
-                elif operator == "greater_than_equal":
-                    new_value = tag_value >= compare_value
-                elif operator == "less_than_equal":
-                    new_value = tag_value <= compare_value
-                else:  # equal
-                    new_value = tag_value == compare_value
+                new_value = _COMPARISONS.get(rule.get("operator"), eq)(tag_value, compare_value)
                     
             elif rule["type"] == "multi_condition":
-                values = []
+                # Conditions after the first unmet one cannot change the outcome, so they are skipped
+                new_value = True
                 for condition in rule["conditions"]:
                     tag_value = await self._get_tag_value(condition["tag"])
                     if tag_value is None:
@@ -405,31 +434,22 @@ class InternalStateService:
                         self._internal_states[state] = False
                         return
                         
-                    operator = condition.get("operator", "equal")
-                    if operator == "greater_than":
-                        values.append(tag_value > compare_value)
-                    elif operator == "less_than":
-                        values.append(tag_value < compare_value)
-                    elif operator == "greater_than_equal":
-                        values.append(tag_value >= compare_value)
-                    elif operator == "less_than_equal":
-                        values.append(tag_value <= compare_value)
-                    else:  # equal
-                        values.append(tag_value == compare_value)
-                
-                new_value = all(values)
+                    if not _COMPARISONS.get(condition.get("operator"), eq)(tag_value, compare_value):
+                        new_value = False
+                        break
 
             elif rule["type"] == "all":
-                # All rule type checks if all specified tags are True
-                values = []
+                # All rule type checks if all specified tags are True, stopping at the first that is not
+                new_value = True
                 for tag in rule["tags"]:
                     tag_value = await self._get_tag_value(tag)
                     if tag_value is None:
                         logger.warning(f"No value for tag: {tag}, setting state {state} to False")
                         self._internal_states[state] = False
                         return
-                    values.append(bool(tag_value))
-                new_value = all(values)
+                    if not tag_value:
+                        new_value = False
+                        break
                 
             else:
                 logger.warning(f"Unknown rule type: {rule['type']}, setting state {state} to False")
@@ -439,7 +459,7 @@ class InternalStateService:
             # Update state if changed
             if state not in self._internal_states or self._internal_states[state] != new_value:
                 self._internal_states[state] = new_value
-                logger.debug(f"Internal state {state} = {new_value} ({rule.get('description', '')})")
+                logger.debug("Internal state {} = {} ({})", state, new_value, rule.get('description', ''))
                 
         except Exception as e:
             logger.error(f"Failed to evaluate state {state}: {e}, setting to False")
@@ -607,7 +627,7 @@ class InternalStateService:
         Args:
             callback: Function to call with updated equipment states
         """
-        self._equipment_state_callbacks.append(callback)
+        self._equipment_state_callbacks.setdefault(callback)
         
     def remove_equipment_state_changed_callback(self, callback: Callable[[Dict[str, bool]], None]) -> None:
         """Remove equipment state change callback.
@@ -615,8 +635,7 @@ class InternalStateService:
         Args:
             callback: Callback to remove
         """
-        if callback in self._equipment_state_callbacks:
-            self._equipment_state_callbacks.remove(callback)
+        self._equipment_state_callbacks.pop(callback, None)
             
     def on_motion_state_changed(self, callback: Callable[[Dict[str, bool]], None]) -> None:
         """Register callback for motion state changes.
@@ -624,7 +643,7 @@ class InternalStateService:
         Args:
             callback: Function to call with updated motion states
         """
-        self._motion_state_callbacks.append(callback)
+        self._motion_state_callbacks.setdefault(callback)
         
     def remove_motion_state_changed_callback(self, callback: Callable[[Dict[str, bool]], None]) -> None:
         """Remove motion state change callback.
@@ -632,13 +651,12 @@ class InternalStateService:
         Args:
             callback: Callback to remove
         """
-        if callback in self._motion_state_callbacks:
-            self._motion_state_callbacks.remove(callback)
+        self._motion_state_callbacks.pop(callback, None)
             
     async def _notify_equipment_state_callbacks(self) -> None:
         """Notify equipment state callbacks of current states."""
         states = await self.get_equipment_states()
-        for callback in self._equipment_state_callbacks:
+        for callback in tuple(self._equipment_state_callbacks):
             try:
                 callback(states)
             except Exception as e:
@@ -647,7 +665,7 @@ class InternalStateService:
     async def _notify_motion_state_callbacks(self) -> None:
         """Notify motion state callbacks of current states."""
         states = await self.get_motion_states()
-        for callback in self._motion_state_callbacks:
+        for callback in tuple(self._motion_state_callbacks):
             try:
                 callback(states)
             except Exception as e:
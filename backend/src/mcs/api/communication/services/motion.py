@@ -1,9 +1,10 @@
 """Motion service implementation."""
 
-from typing import Dict, Any, Callable
-from datetime import datetime
+from typing import Dict, Any, Awaitable, Callable, Tuple
 from fastapi import status
 from loguru import logger
+import asyncio
+import time
 
 from mcs.utils.errors import create_error
 from mcs.utils.health import ServiceHealth, ComponentHealth, HealthStatus, create_error_health
@@ -13,6 +14,43 @@ from mcs.api.communication.models.state import (
     Position, SystemStatus, MotionState, AxisStatus
 )
 
+# Readings younger than this (seconds) are reused instead of re-reading tags
+_STATE_TTL = 0.05
+
+# Tags making up position and system status, in the order _read_position_and_status unpacks them
+_MOTION_TAGS = [
+    "motion.position.x",
+    "motion.position.y",
+    "motion.position.z",
+    "motion.coordinated_move.xy.in_progress",
+    "motion.coordinated_move.xy.status",
+    "motion.relative_move.z.in_progress",
+    "motion.relative_move.z.status",
+    "motion.status.module"
+]
+
+# Shared component health entries, indexed by whether the check passed
+_TAG_CACHE_HEALTH = {
+    True: ComponentHealth(status=HealthStatus.OK),
+    False: ComponentHealth(status=HealthStatus.ERROR, error="Tag cache not running")
+}
+_HARDWARE_HEALTH = {
+    True: ComponentHealth(status=HealthStatus.OK),
+    False: ComponentHealth(status=HealthStatus.DEGRADED, error="Failed to read position")
+}
+
+
+def _axis_status(position: Any, in_progress: Any, complete: Any) -> AxisStatus:
+    """Build axis status from raw move tags."""
+    return AxisStatus(
+        # Default to 0 if position is None
+        position=position if position is not None else 0.0,
+        in_position=bool(complete),  # In position if move completed
+        moving=bool(in_progress),  # Moving if in progress
+        error=False,  # No longer using module status for error detection
+        homed=True  # Assume homed since we don't have explicit homing status
+    )
+
 
 class MotionService:
     """Service for motion control."""
@@ -28,7 +66,14 @@ class MotionService:
         self._config = config  # Store config here
         self._tag_cache = None
         self._internal_state = None
-        self._state_callbacks = []
+        # Registered callbacks as an insertion-ordered set for constant-time removal
+        self._state_callbacks: Dict[Callable[[MotionState], None], None] = {}
+
+        # Recent readings as (monotonic time, reading), by name
+        self._state_cache: Dict[str, Tuple[float, Any]] = {}
+
+        # In-flight readings shared by concurrent callers, by name
+        self._pending_reads: Dict[str, asyncio.Task] = {}
         
         logger.info(f"{self.service_name} service initialized")
 
@@ -50,26 +95,28 @@ class MotionService:
     @property
     def uptime(self) -> float:
         """Get service uptime in seconds."""
-        return (datetime.now() - self._start_time).total_seconds() if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time is not None else 0.0
 
     def on_state_changed(self, callback: Callable[[MotionState], None]) -> None:
         """Register callback for motion state changes."""
-        if callback not in self._state_callbacks:
-            self._state_callbacks.append(callback)
+        self._state_callbacks.setdefault(callback)
 
     def remove_state_changed_callback(self, callback: Callable[[MotionState], None]) -> None:
         """Remove state change callback."""
-        if callback in self._state_callbacks:
-            self._state_callbacks.remove(callback)
+        self._state_callbacks.pop(callback, None)
 
     async def _notify_state_changed(self) -> None:
         """Notify all registered callbacks of state change."""
         try:
-            position = await self.get_position()
-            status = await self.get_status()
-            state = MotionState(position=position, status=status)
+            # Take fresh readings and refresh the query caches with them
+            position, status = await self._read_position_and_status()
+            now = time.monotonic()
+            self._state_cache["position"] = (now, position)
+            self._state_cache["status"] = (now, status)
+            # Parts are already validated models, so skip revalidating the wrapper
+            state = MotionState.model_construct(position=position, status=status)
             
-            for callback in self._state_callbacks:
+            for callback in tuple(self._state_callbacks):
                 try:
                     callback(state)
                 except Exception as e:
@@ -129,14 +176,14 @@ class MotionService:
                     message=f"{self.service_name} service already running"
                 )
 
-            if not self._tag_cache or not self._tag_cache.is_running:
+            if self._tag_cache is None or not self._tag_cache.is_running:
                 raise create_error(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     message=f"{self.service_name} service not initialized"
                 )
             
             self._is_running = True
-            self._start_time = datetime.now()
+            self._start_time = time.monotonic()
             logger.info(f"{self.service_name} service started")
             
         except Exception as e:
@@ -160,6 +207,7 @@ class MotionService:
 
             # Clear state callbacks
             self._state_callbacks.clear()
+            self._state_cache.clear()
             
             # Reset service state
             self._is_running = False
@@ -177,29 +225,19 @@ class MotionService:
 
     async def _get_component_health(self) -> Dict[str, ComponentHealth]:
         """Get health status of all components."""
-        components = {}
-        
-        # Check tag cache status
-        tag_cache_ok = self._tag_cache and self._tag_cache.is_running
-        components["tag_cache"] = ComponentHealth(
-            status=HealthStatus.OK if tag_cache_ok else HealthStatus.ERROR,
-            error=None if tag_cache_ok else "Tag cache not running"
-        )
+        tag_cache_ok = self._tag_cache is not None and self._tag_cache.is_running
+        components = {"tag_cache": _TAG_CACHE_HEALTH[tag_cache_ok]}
         
         # Only check hardware if tag cache is running
         if tag_cache_ok:
             try:
                 # Try to read position to verify communication
                 position = await self._tag_cache.get_tag("motion.position.x")
-                hardware_ok = position is not None
-                components["hardware"] = ComponentHealth(
-                    status=HealthStatus.OK if hardware_ok else HealthStatus.WARN,
-                    error=None if hardware_ok else "Failed to read position"
-                )
+                components["hardware"] = _HARDWARE_HEALTH[position is not None]
             except Exception as e:
                 logger.error(f"Failed to read position: {str(e)}")
                 components["hardware"] = ComponentHealth(
-                    status=HealthStatus.WARN,  # Warn instead of error since motion might not be critical
+                    status=HealthStatus.DEGRADED,  # Degraded instead of error since motion might not be critical
                     error=f"Failed to read position: {str(e)}"
                 )
         
@@ -231,8 +269,51 @@ class MotionService:
             logger.error(error_msg)
             return create_error_health(self.service_name, self.version, error_msg)
 
-    async def get_position(self) -> Position:
-        """Get current position."""
+    async def _cached_read(self, name: str, read: Callable[[], Awaitable[Any]], fresh: bool) -> Any:
+        """Reuse a reading younger than _STATE_TTL, otherwise share one new reading.
+
+        Args:
+            name: Reading name
+            read: Coroutine function performing the reading
+            fresh: Skip the cached reading and any reading already in flight, which
+                may have begun before the caller's last change
+
+        Returns:
+            Any: Cached or new reading
+        """
+        if not fresh:
+            cached = self._state_cache.get(name)
+            if cached is not None and time.monotonic() - cached[0] < _STATE_TTL:
+                return cached[1]
+        task = None if fresh else self._pending_reads.get(name)
+        if task is None:
+            task = asyncio.create_task(read())
+            self._pending_reads[name] = task
+            task.add_done_callback(lambda done: self._read_done(name, done))
+        # Shield so one cancelled caller does not cancel the reading for the others
+        reading = await asyncio.shield(task)
+        self._state_cache[name] = (time.monotonic(), reading)
+        return reading
+
+    def _read_done(self, name: str, task: asyncio.Task) -> None:
+        """Forget a finished reading unless a newer one has replaced it."""
+        if self._pending_reads.get(name) is task:
+            del self._pending_reads[name]
+
+    async def get_position(self, fresh: bool = False) -> Position:
+        """Get current position, reusing a reading younger than _STATE_TTL unless fresh."""
+        return await self._cached_read("position", self._read_position, fresh)
+
+    async def get_status(self, fresh: bool = False) -> SystemStatus:
+        """Get system status, reusing a reading younger than _STATE_TTL unless fresh."""
+        return await self._cached_read("status", self._read_status, fresh)
+
+    async def get_motion_state(self, fresh: bool = False) -> MotionState:
+        """Get current motion state, reusing a reading younger than _STATE_TTL unless fresh."""
+        return await self._cached_read("motion", self._read_motion_state, fresh)
+
+    async def _read_position(self) -> Position:
+        """Read current position from the tag cache."""
         try:
             if not self.is_running:
                 raise create_error(
@@ -240,17 +321,8 @@ class MotionService:
                     message=f"{self.service_name} service not running"
                 )
 
-            # Get current positions from motion.position.*
-            x = await self._tag_cache.get_tag("motion.position.x")
-            y = await self._tag_cache.get_tag("motion.position.y")
-            z = await self._tag_cache.get_tag("motion.position.z")
-
-            # Default to 0 if position is None
-            x = x if x is not None else 0.0
-            y = y if y is not None else 0.0
-            z = z if z is not None else 0.0
-
-            return Position(x=x, y=y, z=z)
+            position, _ = await self._read_position_and_status()
+            return position
 
         except Exception as e:
             error_msg = "Failed to get position"
@@ -260,8 +332,8 @@ class MotionService:
                 message=error_msg
             )
 
-    async def get_status(self) -> SystemStatus:
-        """Get system status."""
+    async def _read_status(self) -> SystemStatus:
+        """Read system status from the tag cache."""
         try:
             if not self.is_running:
                 raise create_error(
@@ -269,22 +341,8 @@ class MotionService:
                     message=f"{self.service_name} service not running"
                 )
 
-            # Get axis statuses
-            x_status = await self.get_axis_status("x")
-            y_status = await self.get_axis_status("y")
-            z_status = await self.get_axis_status("z")
-
-            # Get module ready status
-            module_ready = await self._tag_cache.get_tag("motion.status.module")
-            if module_ready is None:
-                module_ready = False
-
-            return SystemStatus(
-                x_axis=x_status,
-                y_axis=y_status,
-                z_axis=z_status,
-                module_ready=module_ready
-            )
+            _, system_status = await self._read_position_and_status()
+            return system_status
 
         except Exception as e:
             error_msg = "Failed to get system status"
@@ -294,6 +352,30 @@ class MotionService:
                 message=error_msg
             )
 
+    async def _read_position_and_status(self) -> Tuple[Position, SystemStatus]:
+        """Read position and system status from one snapshot of the motion tags."""
+        (
+            x, y, z,
+            xy_in_progress, xy_complete,
+            z_in_progress, z_complete,
+            module_ready
+        ) = await self._tag_cache.get_tags(_MOTION_TAGS)
+
+        position = Position(
+            # Default to 0 if position is None
+            x=x if x is not None else 0.0,
+            y=y if y is not None else 0.0,
+            z=z if z is not None else 0.0
+        )
+        system_status = SystemStatus(
+            # X and Y share the coordinated move status; Z uses its relative move
+            x_axis=_axis_status(x, xy_in_progress, xy_complete),
+            y_axis=_axis_status(y, xy_in_progress, xy_complete),
+            z_axis=_axis_status(z, z_in_progress, z_complete),
+            module_ready=module_ready if module_ready is not None else False
+        )
+        return position, system_status
+
     async def get_axis_status(self, axis: str) -> AxisStatus:
         """Get axis status."""
         try:
@@ -322,22 +404,7 @@ class MotionService:
                 in_progress = await self._tag_cache.get_tag(f"motion.relative_move.{axis}.in_progress")
                 complete = await self._tag_cache.get_tag(f"motion.relative_move.{axis}.status")
 
-            # Parse status
-            in_position = bool(complete)  # In position if move completed
-            moving = bool(in_progress)  # Moving if in progress
-            error = False  # No longer using module status for error detection
-            homed = True   # Assume homed since we don't have explicit homing status
-
-            # Default to 0 if position is None
-            position = current_position if current_position is not None else 0.0
-
-            return AxisStatus(
-                position=position,
-                in_position=in_position,
-                moving=moving,
-                error=error,
-                homed=homed
-            )
+            return _axis_status(current_position, in_progress, complete)
 
         except Exception as e:
             error_msg = f"Failed to get {axis} axis status"
@@ -465,8 +532,8 @@ class MotionService:
                 message=error_msg
             )
 
-    async def get_motion_state(self) -> MotionState:
-        """Get current motion state."""
+    async def _read_motion_state(self) -> MotionState:
+        """Read current motion state, adjusted by internal states."""
         try:
             if not self.is_running:
                 raise create_error(
@@ -474,9 +541,8 @@ class MotionService:
                     message=f"{self.service_name} service not running"
                 )
 
-            # Get position from raw tags
-            position = await self.get_position()
-            system_status = await self.get_status()
+            # Get position and status from raw tags; a fresh reading, since the status is adjusted in place below
+            position, system_status = await self._read_position_and_status()
 
             # Get internal states
             at_valid_position = await self._internal_state.get_state("at_valid_position")
@@ -488,7 +554,7 @@ class MotionService:
             system_status.y_axis.in_position = at_valid_position and not system_status.y_axis.moving
             system_status.z_axis.in_position = at_valid_position and not system_status.z_axis.moving
 
-            return MotionState(
+            return MotionState.model_construct(
                 position=position,
                 status=system_status
             )
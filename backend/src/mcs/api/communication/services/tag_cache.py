@@ -1,23 +1,25 @@
 """Tag cache service implementation."""
 
 import asyncio
-from typing import Dict, Any, Optional, Union, Callable, List, Set
-from datetime import datetime
+from typing import Dict, Any, Optional, Union, Callable, List, Set, TYPE_CHECKING
+import time
 from fastapi import status
 from loguru import logger
 
 from mcs.utils.errors import create_error
 from mcs.utils.health import ServiceHealth, ComponentHealth, HealthStatus, create_error_health
 from mcs.api.communication.clients.mock import MockPLCClient
-from mcs.api.communication.clients.plc import PLCClient
-from mcs.api.communication.clients.ssh import SSHClient
 from mcs.api.communication.services.tag_mapping import TagMappingService
 
+if TYPE_CHECKING:
+    from mcs.api.communication.clients.plc import PLCClient
+    from mcs.api.communication.clients.ssh import SSHClient
+
 
 class TagCacheService:
     """Service for caching PLC tag values."""
     
-    def __init__(self, config: Dict[str, Any], plc_client: Union[PLCClient, MockPLCClient], ssh_client: Optional[SSHClient], tag_mapping: TagMappingService):
+    def __init__(self, config: Dict[str, Any], plc_client: Union["PLCClient", MockPLCClient], ssh_client: Optional["SSHClient"], tag_mapping: TagMappingService):
         """Initialize tag cache service."""
         self._service_name = "tag_cache"
         self._version = "1.0.0"  # Will be updated from config
@@ -37,8 +39,8 @@ class TagCacheService:
         self._plc_tags = []
         self._ssh_tags = []
         
-        # State change callbacks
-        self._state_callbacks: List[Callable[[str, Any], None]] = []
+        # State change callbacks as an insertion-ordered set for constant-time removal
+        self._state_callbacks: Dict[Callable[[str, Any], None], None] = {}
         
         # Tag subscriptions
         self._tag_subscribers: Dict[str, Set[Callable[[str, Any], None]]] = {}
@@ -73,7 +75,7 @@ class TagCacheService:
     @property
     def uptime(self) -> float:
         """Get service uptime in seconds."""
-        return (datetime.now() - self._start_time).total_seconds() if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time is not None else 0.0
 
     async def initialize(self) -> None:
         """Initialize service."""
@@ -217,7 +219,7 @@ class TagCacheService:
                     message=f"{self.service_name} service already running"
                 )
                 
-            if not self._plc_client or not self._tag_mapping:
+            if self._plc_client is None or self._tag_mapping is None:
                 raise create_error(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     message=f"{self.service_name} service not initialized"
@@ -228,7 +230,7 @@ class TagCacheService:
                 await self._plc_client.connect()
             
             self._is_running = True
-            self._start_time = datetime.now()
+            self._start_time = time.monotonic()
             self._polling_task = asyncio.create_task(self._poll_tags())
             logger.info(f"{self.service_name} service started")
             
@@ -313,7 +315,7 @@ class TagCacheService:
             if self._ssh_client:
                 ssh_connected = self._ssh_client.is_connected()
                 components["ssh_client"] = ComponentHealth(
-                    status=HealthStatus.OK if ssh_connected else HealthStatus.WARN,
+                    status=HealthStatus.OK if ssh_connected else HealthStatus.DEGRADED,
                     error=None if ssh_connected else "SSH client not connected"
                 )
             
@@ -361,6 +363,33 @@ class TagCacheService:
             
         return value
 
+    async def get_tags(self, tags: List[str]) -> List[Optional[Any]]:
+        """Get several cached tag values in one call.
+
+        Args:
+            tags: Internal tag names
+
+        Returns:
+            List[Optional[Any]]: Values in the same order, None for unknown or uncached tags
+        """
+        if not self.is_running:
+            raise create_error(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message=f"{self.service_name} service not running"
+            )
+
+        values = []
+        for tag in tags:
+            if not self._tag_mapping.get_tag_info(tag):
+                logger.warning(f"Tag not found in mapping: {tag}")
+                values.append(None)
+                continue
+            value = self._cache.get(tag)
+            if value is None:
+                logger.warning(f"Tag not found in cache: {tag}")
+            values.append(value)
+        return values
+
     async def set_tag(self, internal_tag: str, value: Any) -> None:
         """Set tag value.
         
@@ -397,7 +426,7 @@ class TagCacheService:
                 await self._plc_client.write_tag(plc_tag, value)
                 # Cache will be updated on next poll
             
-            logger.debug(f"Set {internal_tag} ({plc_tag}) = {value}")
+            logger.debug("Set {} ({}) = {}", internal_tag, plc_tag, value)
             
         except Exception as e:
             error_msg = f"Failed to set tag {internal_tag}: {str(e)}"
@@ -460,7 +489,7 @@ class TagCacheService:
             callback: Function to call when state changes. Takes state type and new state.
         """
         if callback not in self._state_callbacks:
-            self._state_callbacks.append(callback)
+            self._state_callbacks[callback] = None
             logger.debug(f"Added state callback: {callback}")
 
     def remove_state_callback(self, callback: Callable[[str, Any], None]) -> None:
@@ -470,7 +499,7 @@ class TagCacheService:
             callback: Callback to remove
         """
         if callback in self._state_callbacks:
-            self._state_callbacks.remove(callback)
+            del self._state_callbacks[callback]
             logger.debug(f"Removed state callback: {callback}")
 
     def _notify_state_callbacks(self, state_type: str, state: Any) -> None:
@@ -480,7 +509,7 @@ class TagCacheService:
             state_type: Type of state that changed
             state: New state value
         """
-        for callback in self._state_callbacks:
+        for callback in tuple(self._state_callbacks):
             try:
                 if asyncio.iscoroutinefunction(callback):
                     asyncio.create_task(callback(state_type, state))
@@ -3,7 +3,7 @@
 import os
 import json
 from typing import Dict, Any, Optional
-from datetime import datetime
+import time
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from loguru import logger
@@ -62,7 +62,7 @@ class TagMappingService:
     @property
     def uptime(self) -> float:
         """Get service uptime in seconds."""
-        return (datetime.now() - self._start_time).total_seconds() if self._start_time else 0.0
+        return time.monotonic() - self._start_time if self._start_time is not None else 0.0
 
     def _load_config(self) -> None:
         """Load tag mapping configuration."""
@@ -167,7 +167,7 @@ class TagMappingService:
                 )
 
             self._is_running = True
-            self._start_time = datetime.now()
+            self._start_time = time.monotonic()
             logger.info(f"{self.service_name} service started")
 
         except Exception as e:
@@ -269,15 +269,15 @@ class TagMappingService:
                 message=f"{self.service_name} service not running"
             )
 
-        logger.debug(f"Looking up PLC tag for {internal_tag}")
+        logger.debug("Looking up PLC tag for {}", internal_tag)
         if internal_tag not in self._tag_map:
             logger.error(f"Tag not found in mapping: {internal_tag}")
             return None
             
         tag_info = self._tag_map[internal_tag]
-        logger.debug(f"Found tag info: {tag_info}")
+        logger.debug("Found tag info: {}", tag_info)
         if not tag_info.get("mapped", False):
-            logger.debug(f"Tag is not mapped: {internal_tag}")
+            logger.debug("Tag is not mapped: {}", internal_tag)
             return None
             
         plc_tag = tag_info.get("plc_tag")
@@ -285,7 +285,7 @@ class TagMappingService:
             logger.error(f"No PLC tag defined for: {internal_tag}")
             return None
             
-        logger.debug(f"Mapped {internal_tag} to PLC tag: {plc_tag}")
+        logger.debug("Mapped {} to PLC tag: {}", internal_tag, plc_tag)
         return plc_tag
 
     def get_internal_tag(self, plc_tag: str) -> Optional[str]:
@@ -1,7 +1,9 @@
 """Error utilities."""
 
-from typing import Optional, Dict, Any
-from fastapi import HTTPException
+import functools
+from typing import Optional, Dict, Any, Awaitable, Callable
+from fastapi import HTTPException, status
+from loguru import logger
 
 
 def create_error(
@@ -30,3 +32,32 @@ def create_error(
         status_code=status_code,
         detail=error_content
     )
+
+
+def handle_errors(message: str) -> Callable:
+    """Translate unexpected endpoint failures into a 500 service error.
+
+    HTTP errors raised by the endpoint pass through unchanged.
+
+    Args:
+        message: Error message prefix, formatted with the endpoint's keyword arguments
+
+    Returns:
+        Callable: Decorator for an async endpoint
+    """
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                error_msg = f"{message.format(**kwargs)}: {str(e)}"
+                logger.error(error_msg)
+                raise create_error(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    message=error_msg
+                )
+        return wrapper
+    return decorator
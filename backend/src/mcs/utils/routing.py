@@ -0,0 +1,131 @@
+"""Shared API routing utilities."""
+
+from hashlib import blake2b
+from typing import Any, Callable, Coroutine, List, Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from orjson import loads as _json_loads
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class FastJSONRequest(Request):
+    """Request that decodes JSON bodies with orjson."""
+
+    async def json(self) -> Any:
+        """Get decoded JSON body."""
+        if not hasattr(self, "_json"):
+            self._json = _json_loads(await self.body())
+        return self._json
+
+
+class FastJSONRoute(APIRoute):
+    """Route that decodes request bodies with FastJSONRequest.
+
+    Body models are still validated by FastAPI and still appear in the
+    OpenAPI schema; only the JSON decode step changes.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Get route handler that wraps incoming requests."""
+        route_handler = super().get_route_handler()
+
+        async def fast_json_route_handler(request: Request) -> Response:
+            return await route_handler(FastJSONRequest(request.scope, request.receive))
+
+        return fast_json_route_handler
+
+
+class ETagMiddleware:
+    """Add ETags to JSON GET responses and answer matching revalidations with 304.
+
+    Only GET requests whose path starts with one of the given prefixes are
+    handled. The body of a 200 response is hashed once to build an ETag,
+    and a request whose ``If-None-Match`` header matches gets
+    ``304 Not Modified`` with no body. Everything else passes through
+    unchanged.
+
+    The ETag is weak (``W/"..."``) because compression further out may send
+    the same body gzip-encoded or as-is, and a strong validator must differ
+    between content-codings.
+
+    Written as a plain ASGI middleware so responses are not re-wrapped in
+    a streaming response on the way out.
+    """
+
+    def __init__(self, app: ASGIApp, prefixes: Sequence[str]):
+        self.app = app
+        self.prefixes = tuple(prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for key, value in scope["headers"]:
+            if key == b"if-none-match":
+                if_none_match = value
+                break
+
+        response_start: Optional[Message] = None
+        passthrough = False
+        body: List[bytes] = []
+
+        async def buffered_send(message: Message) -> None:
+            nonlocal response_start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    # Errors and other statuses get no ETag
+                    passthrough = True
+                    await send(message)
+                else:
+                    response_start = message
+                return
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            content = b"".join(body)
+            opaque_tag = b'"' + blake2b(content, digest_size=8).hexdigest().encode() + b'"'
+            etag = b"W/" + opaque_tag
+            if if_none_match is not None and _etag_matches(if_none_match, opaque_tag):
+                headers = [
+                    (key, value)
+                    for key, value in response_start["headers"]
+                    if key not in (b"content-length", b"content-type")
+                ]
+                headers.append((b"etag", etag))
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            response_start["headers"] = [*response_start["headers"], (b"etag", etag)]
+            await send(response_start)
+            await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, buffered_send)
+
+
+def _etag_matches(if_none_match: bytes, opaque_tag: bytes) -> bool:
+    """Check an If-None-Match header value against an ETag's quoted opaque tag.
+
+    Uses weak comparison as required for If-None-Match, so candidates match
+    with or without the ``W/`` prefix.
+    """
+    if if_none_match.strip() == b"*":
+        return True
+    for candidate in if_none_match.split(b","):
+        candidate = candidate.strip()
+        if candidate.startswith(b"W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
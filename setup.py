@@ -17,8 +17,9 @@ setup(
     },
     install_requires=[
         "fastapi>=0.104.1",
-        "uvicorn>=0.24.0",
+        "uvicorn[standard]>=0.24.0",
         "pydantic>=2.5.2",
+        "orjson>=3.9.0",
         "jsonschema>=4.20.0",
         "productivity>=0.12.0",
         "loguru>=0.7.2",